@@ -27,6 +27,9 @@ ASSETS = [
 START_DATE = "2010-01-01"
 END_DATE = "2025-12-31"
 CACHE_DIR = "data/cache"
+PRICE_DTYPE = "float32"  # fetch_prices output dtype; float32 halves memory downstream
+CACHE_FORMAT = "feather"  # Aligned price-matrix cache: 'feather' (mmap) or 'parquet'
+FETCH_MAX_WORKERS = 16  # Concurrent ticker downloads
 
 # ──────────────────────────────────────────────
 # Backtest Engine
@@ -46,6 +49,7 @@ MAX_LEVERAGE = 1.5  # Total gross exposure cap
 LOOKBACK_WINDOW = 252  # Trading days for return estimation
 COV_METHOD = "ledoit_wolf"  # 'ledoit_wolf', 'sample', 'ewma'
 EWMA_LAMBDA = 0.94  # For EWMA covariance
+COV_CACHE_SIZE = 512  # Rolling-window covariances memoised across signals
 
 # ──────────────────────────────────────────────
 # Monte Carlo
@@ -53,6 +57,10 @@ EWMA_LAMBDA = 0.94  # For EWMA covariance
 MC_NUM_PATHS = 50_000
 MC_HORIZON_DAYS = 252  # 1 year forward simulation
 MC_SEED = 42
+MC_PATH_DTYPE = "float32"  # path buffers; float32 halves memory traffic vs float64
+MC_BACKEND = "numba"  # 'numpy', 'numba' or 'jax' (GPU); missing deps use 'numpy'
+MC_SAMPLING = "antithetic"  # 'mc', 'antithetic', or 'sobol' (variance reduction)
+MC_CHUNK_SIZE = 1024  # paths per block in run_monte_carlo_streaming (~1 MB)
 
 # ──────────────────────────────────────────────
 # Risk
@@ -28,8 +28,8 @@ from pathlib import Path
 
 import config
 from src.data.fetcher import fetch_prices
-from src.engine.backtest import run_backtest
-from src.monte_carlo.simulation import run_monte_carlo
+from src.engine.backtest import bundle_results, run_backtest
+from src.monte_carlo.simulation import run_monte_carlo_streaming
 from src.optimization.equal_weight import equal_weight_signal
 from src.optimization.signals import make_bl_kelly_signal, make_kelly_signal
 from src.risk.metrics import compute_risk_report
@@ -143,13 +143,13 @@ def main() -> None:
         config.MC_NUM_PATHS,
         config.MC_HORIZON_DAYS,
     )
-    mc_result = run_monte_carlo(
+    # Streaming keeps terminal stats + fan percentiles, never all 50k paths
+    mc_result = run_monte_carlo_streaming(
         daily_returns=primary_result.daily_returns,
         n_paths=config.MC_NUM_PATHS,
         n_days=config.MC_HORIZON_DAYS,
         initial_capital=config.INITIAL_CAPITAL,
         seed=config.MC_SEED,
-        store_paths=True,
     )
     logger.info(
         "      P(profit)=%.1f%%  Median terminal $%s",
@@ -167,11 +167,9 @@ def main() -> None:
         "Half-Kelly": hk_result.equity_curve,
         "Full Kelly": fk_result.equity_curve,
     }
-    returns_map = {
-        "Equal Weight": ew_result.daily_returns,
-        "Half-Kelly": hk_result.daily_returns,
-        "Full Kelly": fk_result.daily_returns,
-    }
+    core_bundle = bundle_results(
+        {"Equal Weight": ew_result, "Half-Kelly": hk_result, "Full Kelly": fk_result}
+    )
 
     saved = []
 
@@ -179,15 +177,17 @@ def main() -> None:
     saved.append(p)
     logger.info("      + %s", p.name)
 
-    p = plot_monte_carlo_fan(mc_result.equity_paths, config.INITIAL_CAPITAL)
+    p = plot_monte_carlo_fan(
+        None, config.INITIAL_CAPITAL, fan_percentiles=mc_result.fan_percentiles
+    )
     saved.append(p)
     logger.info("      + %s", p.name)
 
-    p = plot_rolling_sharpe(returns_map)
+    p = plot_rolling_sharpe(core_bundle)
     saved.append(p)
     logger.info("      + %s", p.name)
 
-    p = plot_drawdowns(core_equity_map)
+    p = plot_drawdowns(core_bundle)
     saved.append(p)
     logger.info("      + %s", p.name)
 
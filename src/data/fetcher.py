@@ -7,16 +7,26 @@ caches results as parquet files to avoid redundant API calls.
 
 from __future__ import annotations
 
+import hashlib
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 
+import numpy as np
 import pandas as pd
+import pyarrow.feather as feather
+import pyarrow.parquet as pq
 import yfinance as yf
 
 import config
 
 logger = logging.getLogger(__name__)
 
+# yf.download resets and polls module-global result dicts (yfinance.shared),
+# so concurrent calls clobber each other's data; only one may run at a time
+_DOWNLOAD_LOCK = threading.Lock()
+
 
 def _cache_path(ticker: str) -> Path:
     """Return the parquet cache file path for a given ticker."""
@@ -26,6 +36,60 @@ def _cache_path(ticker: str) -> Path:
     return cache_dir / f"{ticker}.parquet"
 
 
+_MATRIX_SUFFIXES = {"feather": ".feather", "parquet": ".parquet"}
+
+
+def _matrix_cache_path(tickers: list[str], start: str, end: str) -> Path:
+    """Return the cache path for an aligned multi-ticker price matrix."""
+    if config.CACHE_FORMAT not in _MATRIX_SUFFIXES:
+        raise ValueError(
+            f"Unknown cache format '{config.CACHE_FORMAT}'. "
+            f"Choose from: {list(_MATRIX_SUFFIXES)}"
+        )
+    cache_dir = Path(config.CACHE_DIR)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    key = "|".join([",".join(sorted(tickers)), start, end])
+    digest = hashlib.sha1(key.encode()).hexdigest()
+    return cache_dir / f"matrix_{digest}{_MATRIX_SUFFIXES[config.CACHE_FORMAT]}"
+
+
+def _ffill_dropna(prices: pd.DataFrame, limit: int) -> pd.DataFrame:
+    """
+    Equivalent of ``prices.ffill(limit=limit).dropna()`` in one NumPy pass.
+
+    Each cell takes the value at the most recent valid row (a running
+    maximum of valid row indices) when that row is at most ``limit`` rows
+    back; rows with any unfilled cell are then dropped.
+    """
+    arr = prices.to_numpy(dtype=float)
+    rows = np.arange(len(arr))[:, None]
+    last_valid = np.maximum.accumulate(np.where(~np.isnan(arr), rows, -1), axis=0)
+
+    fillable = (last_valid >= 0) & (rows - last_valid <= limit)
+    filled = np.where(
+        fillable, arr[np.maximum(last_valid, 0), np.arange(arr.shape[1])], np.nan
+    )
+    keep = fillable.all(axis=1)
+
+    return pd.DataFrame(filled[keep], index=prices.index[keep], columns=prices.columns)
+
+
+def _read_matrix(path: Path) -> pd.DataFrame:
+    """Read a cached price matrix (format inferred from the file suffix)."""
+    if path.suffix == ".feather":
+        table = feather.read_table(path, memory_map=True)
+        return table.to_pandas(self_destruct=True).set_index("Date")
+    return pd.read_parquet(path)
+
+
+def _write_matrix(prices: pd.DataFrame, path: Path) -> None:
+    """Write a price matrix; Feather is stored uncompressed so reads can mmap."""
+    if path.suffix == ".feather":
+        prices.reset_index().to_feather(path, compression="uncompressed")
+    else:
+        prices.to_parquet(path)
+
+
 def fetch_single(
     ticker: str,
     start: str = config.START_DATE,
@@ -55,20 +119,22 @@ def fetch_single(
 
     if use_cache and cache_file.exists():
         logger.info("Cache hit for %s", ticker)
-        series = pd.read_parquet(cache_file).squeeze()
-        series.name = ticker
-        series.index = pd.DatetimeIndex(series.index)
-        series.index.name = "Date"
-        return series
+        # Memory-mapped single-column read; the DatetimeIndex ("Date") and
+        # series name were fixed at write time, so no post-processing needed
+        table = pq.read_table(
+            cache_file, columns=[ticker], memory_map=True, use_pandas_metadata=True
+        )
+        return table.to_pandas(self_destruct=True)[ticker]
 
     logger.info("Downloading %s from Yahoo Finance [%s → %s]", ticker, start, end)
-    data = yf.download(
-        ticker,
-        start=start,
-        end=end,
-        auto_adjust=True,
-        progress=False,
-    )
+    with _DOWNLOAD_LOCK:
+        data = yf.download(
+            ticker,
+            start=start,
+            end=end,
+            auto_adjust=True,
+            progress=False,
+        )
 
     if data.empty:
         raise ValueError(f"No data returned for ticker '{ticker}'")
@@ -88,7 +154,9 @@ def fetch_single(
     close.index.name = "Date"
 
     if use_cache:
-        close.to_frame().to_parquet(cache_file)
+        close.to_frame().to_parquet(
+            cache_file, engine="pyarrow", compression="zstd", compression_level=3
+        )
         logger.info("Cached %s → %s (%d rows)", ticker, cache_file, len(close))
 
     return close
@@ -112,27 +180,53 @@ def fetch_prices(
     end : str
         End date in YYYY-MM-DD format.
     use_cache : bool
-        If True, read from / write to parquet cache.
+        If True, read from / write to parquet cache. The aligned matrix is
+        cached as a whole (keyed by ticker set + dates, stored as
+        ``config.CACHE_FORMAT``) on top of the per-ticker files, so repeat
+        runs need a single read.
 
     Returns
     -------
     pd.DataFrame
         Columns = tickers, index = DatetimeIndex of trading dates.
-        Forward-fills gaps up to 5 days, then drops remaining NaNs.
+        Forward-fills gaps up to 5 days, then drops remaining NaNs. Values
+        are ``config.PRICE_DTYPE`` (float32 by default).
     """
     if tickers is None:
         tickers = config.ASSETS
 
-    series_list: list[pd.Series] = []
+    # Steady-state path: one read of the already aligned matrix
+    matrix_path = _matrix_cache_path(tickers, start, end)
+    if use_cache and matrix_path.exists():
+        logger.info("Matrix cache hit → %s", matrix_path)
+        prices = _read_matrix(matrix_path)
+        prices = prices[[t for t in tickers if t in prices.columns]]
+        return prices.astype(config.PRICE_DTYPE)
+
+    fetched: dict[str, pd.Series] = {}
     failed: list[str] = []
 
-    for ticker in tickers:
-        try:
-            s = fetch_single(ticker, start=start, end=end, use_cache=use_cache)
-            series_list.append(s)
-        except Exception as exc:
-            logger.warning("Failed to fetch %s: %s", ticker, exc)
-            failed.append(ticker)
+    # One future per ticker: cache reads run concurrently, while the
+    # yf.download calls themselves are serialised by _DOWNLOAD_LOCK
+    max_workers = max(1, min(config.FETCH_MAX_WORKERS, len(tickers)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(
+                fetch_single, ticker, start=start, end=end, use_cache=use_cache
+            ): ticker
+            for ticker in tickers
+        }
+        for future in as_completed(futures):
+            ticker = futures[future]
+            try:
+                fetched[ticker] = future.result()
+            except Exception as exc:
+                logger.warning("Failed to fetch %s: %s", ticker, exc)
+                failed.append(ticker)
+
+    # Restore the caller's ticker order (as_completed yields in finish order)
+    series_list = [fetched[t] for t in tickers if t in fetched]
+    failed = [t for t in tickers if t in failed]
 
     if not series_list:
         raise RuntimeError("No data fetched for any ticker")
@@ -145,7 +239,12 @@ def fetch_prices(
     prices.index.name = "Date"
 
     # Forward-fill short gaps (holidays, missing days), then drop remaining NaNs
-    prices = prices.ffill(limit=5).dropna()
+    prices = _ffill_dropna(prices, limit=5).astype(config.PRICE_DTYPE)
+
+    # Only complete fetches are cached — a transient failure must not stick
+    if use_cache and not failed:
+        _write_matrix(prices, matrix_path)
+        logger.info("Cached price matrix → %s", matrix_path)
 
     logger.info(
         "Price matrix: %d dates × %d assets [%s → %s]",
@@ -159,11 +258,11 @@ def fetch_prices(
 
 
 def clear_cache() -> int:
-    """Remove all cached parquet files. Returns count of files deleted."""
+    """Remove all cached parquet/feather files. Returns count of files deleted."""
     cache_dir = Path(config.CACHE_DIR)
     if not cache_dir.exists():
         return 0
-    files = list(cache_dir.glob("*.parquet"))
+    files = [f for suffix in ("*.parquet", "*.feather") for f in cache_dir.glob(suffix)]
     for f in files:
         f.unlink()
     logger.info("Cleared %d cached files", len(files))
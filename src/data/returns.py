@@ -23,7 +23,8 @@ def compute_log_returns(prices: pd.DataFrame) -> pd.DataFrame:
     Returns
     -------
     pd.DataFrame
-        Log returns ln(P_t / P_{t-1}). First row is dropped (NaN from diff).
+        Log returns ln(P_t / P_{t-1}) in float64, whatever the price dtype.
+        First row is dropped (NaN from diff).
     """
     if prices.empty:
         raise ValueError("Price DataFrame is empty")
@@ -31,6 +32,8 @@ def compute_log_returns(prices: pd.DataFrame) -> pd.DataFrame:
     if (prices <= 0).any().any():
         raise ValueError("Prices must be strictly positive for log returns")
 
+    # Prices may be stored as float32; covariance/Kelly statistics need float64
+    prices = prices.astype(np.float64)
     log_ret = np.log(prices / prices.shift(1))
     return log_ret.iloc[1:]  # drop first NaN row
 
@@ -1,9 +1,18 @@
 """
 Event-driven backtester core loop.
 
-Daily rebalance cycle: generate signals → calculate target weights →
-apply transaction costs and slippage → update portfolio state → log metrics.
+Rebalance cycle: generate signals → calculate target weights →
+apply transaction costs and slippage → drift holdings to the next rebalance
+→ log metrics.
 Tracks equity curve, daily returns, positions, and turnover.
+
+Python-level work happens only on rebalance dates.  Between rebalances the
+holdings drift deterministically with prices, so each holding period is
+marked to market in one vectorised NumPy step.  The loop tracks weights as
+fractions of equity; because the default costs are proportional to equity,
+turnover, costs and the dollar equity path are settled for all rebalances
+at once.  Cost models that override ``trading_cost`` or ``turnover`` are
+settled one rebalance at a time at each rebalance's dollar value.
 """
 
 from __future__ import annotations
@@ -16,6 +25,7 @@ import numpy as np
 import pandas as pd
 
 import config
+from src.data.returns import compute_log_returns
 from src.engine.costs import TransactionCostModel
 
 logger = logging.getLogger(__name__)
@@ -27,7 +37,14 @@ logger = logging.getLogger(__name__)
 
 
 class SignalProvider(Protocol):
-    """Protocol for strategy signal generators."""
+    """
+    Protocol for strategy signal generators.
+
+    Signals that expose ``accepts_log_returns = True`` are additionally
+    called with ``log_returns=`` — the backtester's precomputed log-return
+    history up to and including ``date`` — so they can slice their lookback
+    window instead of recomputing ``np.log`` from prices at every rebalance.
+    """
 
     def __call__(
         self,
@@ -39,30 +56,6 @@ class SignalProvider(Protocol):
         ...
 
 
-# ---------------------------------------------------------------------------
-# Portfolio state snapshot
-# ---------------------------------------------------------------------------
-
-
-@dataclass
-class PortfolioState:
-    """Mutable state of the portfolio at a point in time."""
-
-    cash: float
-    holdings: pd.Series  # dollar value per asset
-    equity: float = 0.0
-
-    def weights(self) -> pd.Series:
-        """Current portfolio weights (0 if equity is zero)."""
-        if self.equity <= 0:
-            return self.holdings * 0.0
-        return self.holdings / self.equity
-
-    def update_equity(self) -> None:
-        """Recalculate total equity = cash + sum(holdings)."""
-        self.equity = self.cash + self.holdings.sum()
-
-
 # ---------------------------------------------------------------------------
 # Backtest result container
 # ---------------------------------------------------------------------------
@@ -102,26 +95,115 @@ class BacktestResult:
         return float(drawdown.min())
 
 
+@dataclass
+class BacktestBundle:
+    """
+    Structure-of-arrays view of several backtests on a shared calendar.
+
+    Column ``s`` of each matrix belongs to strategy ``names[s]``, so
+    cross-strategy statistics run as one vectorised pass over axis 0.
+    Dates a strategy does not cover are NaN in its column.
+    """
+
+    dates: pd.DatetimeIndex
+    names: list[str]
+    returns: np.ndarray  # (T, S) daily returns
+    equity: np.ndarray  # (T, S) equity curves
+
+
+def bundle_results(results: dict[str, BacktestResult]) -> BacktestBundle:
+    """
+    Stack per-strategy results into a BacktestBundle.
+
+    Parameters
+    ----------
+    results : dict[str, BacktestResult]
+        Strategy name → result. Dates are aligned on their union; each
+        column is NaN outside its own strategy's date range.
+
+    Returns
+    -------
+    BacktestBundle
+    """
+    if not results:
+        raise ValueError("No backtest results to bundle")
+
+    names = list(results)
+    returns = pd.concat([results[n].daily_returns for n in names], axis=1, keys=names)
+    equity = pd.concat(
+        [results[n].equity_curve for n in names], axis=1, keys=names
+    ).reindex(returns.index)
+
+    return BacktestBundle(
+        dates=pd.DatetimeIndex(returns.index),
+        names=names,
+        returns=returns.to_numpy(dtype=float),
+        equity=equity.to_numpy(dtype=float),
+    )
+
+
 # ---------------------------------------------------------------------------
 # Rebalance schedule helpers
 # ---------------------------------------------------------------------------
 
 
-def _should_rebalance(
-    date: pd.Timestamp,
-    prev_date: pd.Timestamp | None,
-    freq: str,
-) -> bool:
-    """Determine whether to rebalance on this date."""
+def _rebalance_mask(dates: pd.DatetimeIndex, freq: str) -> np.ndarray:
+    """
+    Boolean mask of rebalance dates over a full date index.
+
+    'daily' rebalances every day; 'monthly' on the first date of the index
+    and on each date whose month differs from the previous date's.
+    """
     if freq == "daily":
-        return True
+        return np.ones(len(dates), dtype=bool)
     if freq == "monthly":
-        if prev_date is None:
-            return True
-        return date.month != prev_date.month
+        months = dates.month.to_numpy()
+        mask = np.ones(len(dates), dtype=bool)
+        mask[1:] = months[1:] != months[:-1]
+        return mask
     raise ValueError(f"Unknown rebalance frequency: '{freq}'")
 
 
+def _settle_rebalances(
+    cost_model: TransactionCostModel,
+    trades: np.ndarray,
+    entry_growth: np.ndarray,
+    initial_capital: float,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Turnover, cost fraction and post-trade equity for every rebalance.
+
+    The default model's costs are proportional to equity, so each rebalance
+    scales the path by (1 − cost fraction) and the post-trade equity is a
+    cumulative product.  A subclass that overrides ``trading_cost`` or
+    ``turnover`` (e.g. a fixed fee) stays the source of truth: it is called
+    once per rebalance with that rebalance's pre-trade dollar value.
+    """
+    model = type(cost_model)
+    if (
+        model.trading_cost is TransactionCostModel.trading_cost
+        and model.turnover is TransactionCostModel.turnover
+    ):
+        turnover, cost_fraction = cost_model.rebalance_costs(trades)
+        post_trade = initial_capital * np.cumprod(entry_growth * (1.0 - cost_fraction))
+        return turnover, cost_fraction, post_trade
+
+    n_rebalances = len(trades)
+    turnover = np.empty(n_rebalances)
+    cost_fraction = np.zeros(n_rebalances)
+    post_trade = np.empty(n_rebalances)
+    value = initial_capital
+    for k in range(n_rebalances):
+        value *= entry_growth[k]
+        turnover[k] = cost_model.turnover(trades[k])
+        if value > 0:
+            cost = cost_model.trading_cost(trades[k], value)
+            cost_fraction[k] = cost / value
+            value -= cost
+        post_trade[k] = value
+    return turnover, cost_fraction, post_trade
+
+
 # ---------------------------------------------------------------------------
 # Core backtester
 # ---------------------------------------------------------------------------
@@ -144,12 +226,15 @@ def run_backtest(
     signal_fn : callable
         ``signal_fn(date, prices_up_to_date, current_weights) → target_weights``
         Must return a pd.Series indexed by ticker with target weights summing to ≤ 1.
+        Signals with ``accepts_log_returns = True`` also receive
+        ``log_returns=`` (see SignalProvider).
     initial_capital : float
         Starting portfolio value.
     rebalance_freq : str
         'daily' or 'monthly'.
     cost_model : TransactionCostModel or None
-        If None, uses default from config.
+        If None, uses default from config. Subclasses may override
+        ``trading_cost`` / ``turnover``; they are honoured per rebalance.
 
     Returns
     -------
@@ -163,80 +248,100 @@ def run_backtest(
 
     tickers = prices.columns.tolist()
     dates = prices.index
-
-    # --- Initialize state ---
-    state = PortfolioState(
-        cash=initial_capital,
-        holdings=pd.Series(0.0, index=tickers),
+    price_matrix = prices.to_numpy(dtype=float)
+    n_days, n_assets = price_matrix.shape
+
+    # Log returns computed once for the whole history; row i-1 is date i
+    log_returns = (
+        compute_log_returns(prices)
+        if getattr(signal_fn, "accepts_log_returns", False)
+        else None
     )
-    state.update_equity()
-
-    # --- Result accumulators ---
-    equity_log: dict[pd.Timestamp, float] = {}
-    return_log: dict[pd.Timestamp, float] = {}
-    position_log: dict[pd.Timestamp, pd.Series] = {}
-    turnover_log: dict[pd.Timestamp, float] = {}
-    cost_log: dict[pd.Timestamp, float] = {}
-
-    prev_date: pd.Timestamp | None = None
-    prev_equity = initial_capital
-
-    for i, date in enumerate(dates):
-        # ── 1. Mark-to-market: update holdings with today's price changes ──
-        if i > 0:
-            daily_price_returns = prices.iloc[i] / prices.iloc[i - 1] - 1.0
-            state.holdings = state.holdings * (1.0 + daily_price_returns)
-            state.update_equity()
-
-        # ── 2. Check rebalance schedule ──
-        if _should_rebalance(date, prev_date, rebalance_freq):
-            current_weights = state.weights()
-
-            # ── 3. Get target weights from signal ──
-            prices_so_far = prices.iloc[: i + 1]
-            target_weights = signal_fn(date, prices_so_far, current_weights)
-
-            # Ensure target_weights is aligned
-            target_weights = target_weights.reindex(tickers, fill_value=0.0)
-
-            # ── 4. Compute trades ──
-            trade_weights = target_weights - current_weights
 
-            # ── 5. Apply costs ──
-            cost_dollars = cost_model.trading_cost(trade_weights, state.equity)
-            turn = cost_model.turnover(trade_weights)
-
-            # ── 6. Execute rebalance ──
-            state.cash -= cost_dollars
-            state.update_equity()
-
-            # Reallocate holdings to target weights (after cost deduction)
-            state.holdings = target_weights * state.equity
-            state.cash = state.equity - state.holdings.sum()
-            state.update_equity()
-
-            turnover_log[date] = turn
-            cost_log[date] = cost_dollars
+    # --- Rebalance schedule: each rebalance opens a holding period ---
+    rebalance_idx = np.flatnonzero(_rebalance_mask(dates, rebalance_freq))
+    period_ends = np.append(rebalance_idx[1:], n_days)
+
+    # --- Per-rebalance state, in fractions of current equity (scale-free) ---
+    n_rebalances = len(rebalance_idx)
+    trades = np.zeros((n_rebalances, n_assets))  # target − pre-trade weights
+    entry_growth = np.ones(n_rebalances)  # equity multiple over the prior period
+    growth = np.empty(n_days)  # equity multiple since the period's rebalance
+    weights = np.zeros((n_days, n_assets))
+
+    held = np.zeros(n_assets)  # post-trade asset weights of the open period
+    cash = 1.0  # post-trade cash weight (starts fully in cash)
+
+    for k, (i, end) in enumerate(zip(rebalance_idx, period_ends)):
+        date = dates[i]
+
+        # ── 1. Mark-to-market: drift the open period's weights to today ──
+        current = np.zeros(n_assets)
+        if k:
+            drifted = held * (price_matrix[i] / price_matrix[rebalance_idx[k - 1]])
+            entry_growth[k] = cash + drifted.sum()
+            if entry_growth[k] > 0:
+                current = drifted / entry_growth[k]
+
+        # ── 2. Get target weights from signal ──
+        current_weights = pd.Series(current, index=tickers)
+        prices_so_far = prices.iloc[: i + 1]
+        if log_returns is not None:
+            target_weights = signal_fn(
+                date,
+                prices_so_far,
+                current_weights,
+                log_returns=log_returns.iloc[:i],
+            )
         else:
-            turnover_log[date] = 0.0
-            cost_log[date] = 0.0
-
-        # ── 7. Log daily state ──
-        equity_log[date] = state.equity
-        position_log[date] = state.weights().copy()
+            target_weights = signal_fn(date, prices_so_far, current_weights)
 
-        daily_ret = (state.equity / prev_equity - 1.0) if prev_equity > 0 else 0.0
-        return_log[date] = daily_ret
-        prev_equity = state.equity
-        prev_date = date
+        # Ensure target_weights is aligned
+        target = target_weights.reindex(tickers, fill_value=0.0).to_numpy(dtype=float)
+
+        # ── 3. Record the trade; costs are settled for all rebalances below ──
+        trades[k] = target - current
+        held = target
+        cash = 1.0 - target.sum()
+
+        # ── 4. Holding period [i, end): cash fixed, holdings drift with prices ──
+        period_holdings = held * (price_matrix[i:end] / price_matrix[i])
+        growth[i:end] = cash + period_holdings.sum(axis=1)
+        np.divide(
+            period_holdings,
+            growth[i:end, None],
+            out=weights[i:end],
+            where=growth[i:end, None] > 0,
+        )
+
+    # --- Costs and equity for every rebalance ---
+    rebalance_turnover, cost_fraction, post_trade = _settle_rebalances(
+        cost_model, trades, entry_growth, initial_capital
+    )
+    pre_trade = np.append(initial_capital, post_trade[:-1]) * entry_growth
+
+    equity = growth * np.repeat(post_trade, period_ends - rebalance_idx)
+    turnover = np.zeros(n_days)
+    costs = np.zeros(n_days)
+    turnover[rebalance_idx] = rebalance_turnover
+    costs[rebalance_idx] = cost_fraction * pre_trade
+
+    # --- Daily returns from the equity path ---
+    prev_equity = np.empty(n_days)
+    prev_equity[0] = initial_capital
+    prev_equity[1:] = equity[:-1]
+    daily_returns = np.zeros(n_days)
+    np.divide(equity, prev_equity, out=daily_returns, where=prev_equity > 0)
+    daily_returns[prev_equity > 0] -= 1.0
 
     # --- Build result ---
+    index = dates.rename(None)
     result = BacktestResult(
-        equity_curve=pd.Series(equity_log, name="equity"),
-        daily_returns=pd.Series(return_log, name="return"),
-        positions=pd.DataFrame(position_log).T,
-        turnover=pd.Series(turnover_log, name="turnover"),
-        total_costs=pd.Series(cost_log, name="costs"),
+        equity_curve=pd.Series(equity, index=index, name="equity"),
+        daily_returns=pd.Series(daily_returns, index=index, name="return"),
+        positions=pd.DataFrame(weights, index=index, columns=tickers),
+        turnover=pd.Series(turnover, index=index, name="turnover"),
+        total_costs=pd.Series(costs, index=index, name="costs"),
     )
 
     logger.info(
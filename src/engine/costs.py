@@ -79,6 +79,29 @@ class TransactionCostModel:
         """
         return float(np.sum(np.abs(trade_weights))) / 2.0
 
+    def rebalance_costs(
+        self,
+        trade_matrix: np.ndarray,
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Turnover and cost drag for a batch of rebalances.
+
+        Row-wise equivalent of ``turnover`` and ``trading_cost / value``.
+
+        Parameters
+        ----------
+        trade_matrix : np.ndarray
+            Signed weight changes, shape (K, N) — one row per rebalance.
+
+        Returns
+        -------
+        tuple[np.ndarray, np.ndarray]
+            One-way turnover and cost as a fraction of portfolio value,
+            each of shape (K,).
+        """
+        traded = np.abs(trade_matrix).sum(axis=1)
+        return traded / 2.0, traded * (self.cost_rate + self.slippage_rate)
+
     def net_return_after_costs(
         self,
         gross_return: float,
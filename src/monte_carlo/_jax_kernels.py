@@ -0,0 +1,88 @@
+"""
+JAX kernels for the Monte Carlo simulator.
+
+The univariate path generator (shocks → scale → cumsum → drawdown) is a
+single jitted XLA program, so on a GPU the whole (n_paths × n_days) block is
+generated and reduced on device. Only the per-path summaries — and the log
+wealth matrix when equity curves are requested — are copied back to host.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+
+import jax
+import jax.numpy as jnp
+import numpy as np
+
+
+def gpu_available() -> bool:
+    """True if JAX's default device is an accelerator rather than the CPU."""
+    return jax.default_backend() != "cpu"
+
+
+@partial(
+    jax.jit,
+    static_argnames=("n_paths", "n_days", "antithetic", "store_paths", "dtype"),
+)
+def _simulate(key, mu, sigma, n_paths, n_days, antithetic, store_paths, dtype):
+    if antithetic:
+        half = jax.random.normal(key, ((n_paths + 1) // 2, n_days), dtype=dtype)
+        shocks = jnp.concatenate([half, -half])[:n_paths]
+    else:
+        shocks = jax.random.normal(key, (n_paths, n_days), dtype=dtype)
+
+    log_wealth = jnp.cumsum(mu + sigma * shocks, axis=1)
+
+    # Same log-space drawdown as the NumPy path; initial capital is log 0.0
+    peaks = jnp.maximum(jax.lax.cummax(log_wealth, axis=1), 0.0)
+    max_drawdowns = jnp.expm1(-(peaks - log_wealth).max(axis=1))
+    return (log_wealth if store_paths else None), log_wealth[:, -1], max_drawdowns
+
+
+def simulate_paths(
+    mu: float,
+    sigma: float,
+    n_paths: int,
+    n_days: int,
+    seed: int,
+    antithetic: bool,
+    store_paths: bool,
+    dtype: np.dtype,
+) -> tuple[np.ndarray | None, np.ndarray, np.ndarray]:
+    """
+    Simulate iid normal log-return paths on the default JAX device.
+
+    Parameters
+    ----------
+    mu, sigma : float
+        Daily log-return mean and standard deviation.
+    n_paths, n_days : int
+        Path count and horizon (static — one compilation per shape).
+    seed : int
+        Seed for ``jax.random.PRNGKey``.
+    antithetic : bool
+        If True, the second half of the paths are the negated first half.
+    store_paths : bool
+        Whether to copy the full log wealth matrix back to host.
+    dtype : np.dtype
+        Shock dtype; float64 requires ``jax_enable_x64``.
+
+    Returns
+    -------
+    tuple
+        (log_wealth or None, terminal log wealth, max drawdowns) as NumPy
+        arrays; ``log_wealth`` has shape (n_paths, n_days).
+    """
+    log_wealth, terminal_log, max_drawdowns = _simulate(
+        jax.random.PRNGKey(seed),
+        mu,
+        sigma,
+        n_paths,
+        n_days,
+        antithetic,
+        store_paths,
+        jnp.dtype(dtype),
+    )
+    paths = np.asarray(log_wealth) if log_wealth is not None else None
+    return paths, np.asarray(terminal_log), np.asarray(max_drawdowns)
@@ -0,0 +1,153 @@
+"""
+Numba kernels for the Monte Carlo simulator.
+
+The univariate path generator fuses shock generation, scaling, the
+cumulative log-return sum, and exponentiation into a single pass per path,
+parallelised across paths with ``prange``.
+
+Each path (or antithetic pair of paths) owns an independent xoroshiro128+
+stream seeded via splitmix64 from ``(seed, path_index)``, so results are
+reproducible regardless of the number of threads Numba schedules.
+
+Every kernel is compiled with ``cache=True`` so the machine code is written
+next to this module on first use and reloaded by later processes; see
+``simulation.warmup_numba`` to pay the remaining one-off cost off the hot path.
+"""
+
+from __future__ import annotations
+
+import math
+
+import numpy as np
+from numba import njit, prange
+
+_GOLDEN = np.uint64(0x9E3779B97F4A7C15)
+_MIX1 = np.uint64(0xBF58476D1CE4E5B9)
+_MIX2 = np.uint64(0x94D049BB133111EB)
+_TWO_PI = 2.0 * math.pi
+_INV_2_53 = 1.0 / 9007199254740992.0  # 2**-53
+
+
+@njit(cache=True, inline="always")
+def _splitmix64(x: np.uint64) -> np.uint64:
+    """Finalising mix of splitmix64 — maps any 64-bit input to a well-spread state."""
+    x = (x ^ (x >> np.uint64(30))) * _MIX1
+    x = (x ^ (x >> np.uint64(27))) * _MIX2
+    return x ^ (x >> np.uint64(31))
+
+
+@njit(cache=True, inline="always")
+def _stream_state(base: np.uint64, stream: np.uint64):
+    """
+    xoroshiro128+ state (s0, s1) for ``stream`` under seed ``base``.
+
+    The key is a bijection of ``(base, stream)`` and both words come from
+    chained splitmix64 steps on it, so distinct streams never share a word.
+    """
+    key = _splitmix64(base ^ (stream * _GOLDEN))
+    s0 = _splitmix64(key)
+    s1 = _splitmix64(s0 + _GOLDEN)
+    return s0, s1
+
+
+@njit(cache=True, inline="always")
+def _rotl(x: np.uint64, k: np.uint64) -> np.uint64:
+    return (x << k) | (x >> (np.uint64(64) - k))
+
+
+@njit(cache=True, inline="always")
+def _uniform(s0: np.uint64, s1: np.uint64):
+    """One xoroshiro128+ step → (uniform in (0, 1], new s0, new s1)."""
+    result = s0 + s1
+    s1 ^= s0
+    s0 = _rotl(s0, np.uint64(24)) ^ s1 ^ (s1 << np.uint64(16))
+    s1 = _rotl(s1, np.uint64(37))
+    u = (float(result >> np.uint64(11)) + 1.0) * _INV_2_53
+    return u, s0, s1
+
+
+@njit(parallel=True, fastmath=True, cache=True, boundscheck=False)
+def simulate_paths(
+    equity: np.ndarray,
+    terminal_wealth: np.ndarray,
+    max_drawdowns: np.ndarray,
+    mu: float,
+    sigma: float,
+    initial_capital: float,
+    seed: int,
+    n_days: int,
+    store_paths: bool,
+    antithetic: bool,
+) -> None:
+    """
+    Simulate iid normal log-return paths in place.
+
+    Parameters
+    ----------
+    equity : np.ndarray
+        Output buffer of shape (n_paths, n_days+1). Only written when
+        ``store_paths`` is True (pass a (0, 0) array otherwise).
+    terminal_wealth : np.ndarray
+        Output buffer of shape (n_paths,).
+    max_drawdowns : np.ndarray
+        Output buffer of shape (n_paths,), negative values.
+    mu, sigma : float
+        Daily log-return mean and standard deviation.
+    initial_capital : float
+        Starting portfolio value.
+    seed : int
+        Base seed; path ``i`` uses the stream derived from ``(seed, i)``.
+    n_days : int
+        Simulation horizon in trading days.
+    store_paths : bool
+        Whether to write full equity curves into ``equity``.
+    antithetic : bool
+        If True, path ``i + ceil(n_paths/2)`` replays the stream of path
+        ``i`` with negated shocks.
+    """
+    n_paths = terminal_wealth.shape[0]
+    half = (n_paths + 1) // 2
+    base = np.uint64(seed)
+
+    for i in prange(n_paths):
+        stream = i
+        sign = 1.0
+        if antithetic and i >= half:
+            stream = i - half
+            sign = -1.0
+
+        s0, s1 = _stream_state(base, np.uint64(stream))
+
+        if store_paths:
+            equity[i, 0] = initial_capital
+
+        log_w = 0.0
+        peak = 0.0
+        depth = 0.0
+        spare = 0.0
+        has_spare = False
+
+        for t in range(n_days):
+            # Box-Muller produces shocks in pairs; keep the second for next day
+            if has_spare:
+                z = spare
+                has_spare = False
+            else:
+                u1, s0, s1 = _uniform(s0, s1)
+                u2, s0, s1 = _uniform(s0, s1)
+                r = math.sqrt(-2.0 * math.log(u1))
+                z = r * math.cos(_TWO_PI * u2)
+                spare = r * math.sin(_TWO_PI * u2)
+                has_spare = True
+
+            log_w += mu + sigma * sign * z
+            if log_w > peak:
+                peak = log_w
+            elif peak - log_w > depth:
+                depth = peak - log_w
+
+            if store_paths:
+                equity[i, t + 1] = initial_capital * math.exp(log_w)
+
+        terminal_wealth[i] = initial_capital * math.exp(log_w)
+        max_drawdowns[i] = math.expm1(-depth)
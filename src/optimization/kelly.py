@@ -7,8 +7,10 @@ Computes optimal portfolio weights via f* = C^{-1}(μ − r), then applies:
   - Total gross leverage cap (default 1.5×)
   - Zero-weight for assets with negative expected excess return
 
-Uses np.linalg.solve instead of matrix inversion for numerical stability.
-Falls back to least-squares (np.linalg.lstsq) if the covariance is singular.
+Solves the SPD system with a Cholesky factorisation (scipy.linalg.cho_factor /
+cho_solve) — never an explicit inverse, and about half the flops of LU.
+Falls back to least-squares (np.linalg.lstsq) if the covariance is singular
+or not positive definite.
 """
 
 from __future__ import annotations
@@ -17,6 +19,7 @@ import logging
 
 import numpy as np
 import pandas as pd
+from scipy.linalg import cho_factor, cho_solve
 
 import config
 
@@ -102,13 +105,15 @@ def kelly_weights(
 
 def _solve_kelly(cov: np.ndarray, excess_returns: np.ndarray) -> np.ndarray:
     """
-    Solve C @ f = excess_returns using np.linalg.solve.
+    Solve C @ f = excess_returns via Cholesky.
 
-    Falls back to least-squares if the covariance matrix is singular.
+    Falls back to least-squares if the covariance matrix is singular or
+    not positive definite (Cholesky raises on a non-positive pivot).
     """
     try:
-        weights = np.linalg.solve(cov, excess_returns)
+        factor = cho_factor(cov, lower=True, check_finite=False)
+        weights = cho_solve(factor, excess_returns, check_finite=False)
     except np.linalg.LinAlgError:
-        logger.warning("Singular covariance matrix; falling back to lstsq")
+        logger.warning("Covariance matrix not positive definite; falling back to lstsq")
         weights, _, _, _ = np.linalg.lstsq(cov, excess_returns, rcond=None)
     return weights
@@ -3,11 +3,17 @@ Signal factories that wire optimizers into the backtester.
 
 Each factory returns a callable matching the SignalProvider protocol:
     signal_fn(date, prices, current_weights) → target_weights
+
+The Kelly signals also accept the backtester's precomputed ``log_returns``
+history (``accepts_log_returns = True``) and slice their lookback window
+from it; called without it they derive the window from ``prices``.
 """
 
 from __future__ import annotations
 
+import hashlib
 import logging
+from collections import OrderedDict
 from typing import Callable
 
 import numpy as np
@@ -24,6 +30,84 @@ from src.optimization.kelly import kelly_weights
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Shared covariance cache
+# ---------------------------------------------------------------------------
+
+# LRU of daily covariance matrices keyed by window fingerprint.  Shared by
+# every signal in the process, so Half-Kelly, Full Kelly and BL + Kelly
+# estimate Σ once per rebalance date instead of once per strategy.
+_COV_CACHE: OrderedDict[tuple, pd.DataFrame] = OrderedDict()
+
+
+def _window_key(log_returns: pd.DataFrame, method: str) -> tuple:
+    """Fingerprint a returns window by its bounds, labels and raw values."""
+    values = np.ascontiguousarray(log_returns.to_numpy())
+    digest = hashlib.blake2b(values.tobytes(), digest_size=16).digest()
+    return (
+        method,
+        tuple(log_returns.columns),
+        log_returns.index[0],
+        log_returns.index[-1],
+        values.shape,
+        digest,
+    )
+
+
+def compute_covariance_cached(
+    log_returns: pd.DataFrame,
+    method: str = config.COV_METHOD,
+    estimator: CovarianceEstimator | None = None,
+) -> pd.DataFrame:
+    """
+    Daily covariance of a log-return window, memoised across signals.
+
+    Parameters
+    ----------
+    log_returns : pd.DataFrame
+        Lookback window of daily log returns (window end = last index date).
+    method : str
+        Covariance estimator name ('sample', 'ledoit_wolf', 'ewma').
+    estimator : CovarianceEstimator or None
+        Estimator used on a cache miss.  Must implement ``method``.
+        Defaults to a fresh estimator.
+
+    Returns
+    -------
+    pd.DataFrame
+        N×N daily (not annualised) covariance.  Shared between callers —
+        treat as read-only.
+    """
+    key = _window_key(log_returns, method)
+    cov = _COV_CACHE.get(key)
+    if cov is not None:
+        _COV_CACHE.move_to_end(key)
+        return cov
+
+    if estimator is None:
+        estimator = get_covariance_estimator(method)
+    cov = estimator.estimate(log_returns)
+    _COV_CACHE[key] = cov
+    if len(_COV_CACHE) > config.COV_CACHE_SIZE:
+        _COV_CACHE.popitem(last=False)
+    return cov
+
+
+def clear_covariance_cache() -> None:
+    """Drop all memoised covariance matrices."""
+    _COV_CACHE.clear()
+
+
+def _lookback_log_returns(
+    prices: pd.DataFrame,
+    log_returns: pd.DataFrame | None,
+    lookback: int,
+) -> pd.DataFrame:
+    """Last ``lookback`` log returns — sliced if precomputed, else from prices."""
+    if log_returns is not None:
+        return log_returns.iloc[-lookback:]
+    return compute_log_returns(prices.iloc[-(lookback + 1) :])
+
 
 def make_kelly_signal(
     lookback: int = config.LOOKBACK_WINDOW,
@@ -68,6 +152,7 @@ def make_kelly_signal(
         date: pd.Timestamp,
         prices: pd.DataFrame,
         current_weights: pd.Series,
+        log_returns: pd.DataFrame | None = None,
     ) -> pd.Series:
         n_assets = len(current_weights)
 
@@ -76,15 +161,17 @@ def make_kelly_signal(
             # Not enough data yet — hold equal weight as warm-up
             return pd.Series(1.0 / n_assets, index=current_weights.index)
 
-        # Use the last `lookback` days of prices
-        window_prices = prices.iloc[-(lookback + 1) :]
-        log_returns = compute_log_returns(window_prices)
+        # Use the last `lookback` days of returns
+        log_returns = _lookback_log_returns(prices, log_returns, lookback)
 
         # Annualized expected returns (mean daily log return × 252)
         mu = log_returns.mean() * trading_days
 
-        # Annualized covariance (daily cov × 252)
-        cov = cov_estimator.estimate(log_returns) * trading_days
+        # Annualized covariance (daily cov × 252), shared across signals
+        cov = (
+            compute_covariance_cached(log_returns, cov_method, cov_estimator)
+            * trading_days
+        )
 
         weights = kelly_weights(
             expected_returns=mu,
@@ -97,6 +184,7 @@ def make_kelly_signal(
 
         return weights
 
+    signal_fn.accepts_log_returns = True
     return signal_fn
 
 
@@ -146,17 +234,20 @@ def make_bl_kelly_signal(
         date: pd.Timestamp,
         prices: pd.DataFrame,
         current_weights: pd.Series,
+        log_returns: pd.DataFrame | None = None,
     ) -> pd.Series:
         n_assets = len(current_weights)
 
         if len(prices) < lookback + 1:
             return pd.Series(1.0 / n_assets, index=current_weights.index)
 
-        window_prices = prices.iloc[-(lookback + 1) :]
-        log_returns = compute_log_returns(window_prices)
+        log_returns = _lookback_log_returns(prices, log_returns, lookback)
 
         # Annualised Ledoit-Wolf covariance
-        cov = cov_estimator.estimate(log_returns) * trading_days
+        cov = (
+            compute_covariance_cached(log_returns, "ledoit_wolf", cov_estimator)
+            * trading_days
+        )
 
         # BL posterior returns (replaces raw historical mean)
         mu = bl_estimator.estimate(log_returns, cov)
@@ -172,4 +263,5 @@ def make_bl_kelly_signal(
 
         return weights
 
+    signal_fn.accepts_log_returns = True
     return signal_fn
@@ -4,7 +4,9 @@ Risk and performance metrics.
 Sharpe ratio, Sortino ratio, maximum drawdown, Value-at-Risk,
 Conditional VaR, Calmar ratio, and rolling statistics.
 
-All functions accept a pd.Series of daily returns (simple or log).
+All scalar functions accept a pd.Series of daily returns (simple or log).
+``rolling_sharpe`` and ``drawdowns`` operate on (T, S) NumPy matrices —
+one column per strategy (see ``BacktestBundle``) — in a single pass.
 Annualization assumes 252 trading days per year.
 """
 
@@ -17,6 +19,11 @@ import pandas as pd
 
 import config
 
+try:
+    import bottleneck as bn
+except ImportError:  # bottleneck is optional — fall back to cumulative sums
+    bn = None
+
 TRADING_DAYS = 252
 
 
@@ -205,6 +212,96 @@ def profit_factor(daily_returns: pd.Series) -> float:
     return float(gains / losses)
 
 
+# ---------------------------------------------------------------------------
+# Vectorised statistics over a (T, S) strategy matrix
+# ---------------------------------------------------------------------------
+
+
+def rolling_sharpe(
+    returns: np.ndarray,
+    window: int = config.ROLLING_SHARPE_WINDOW,
+    risk_free_rate: float = config.RISK_FREE_RATE,
+) -> np.ndarray:
+    """
+    Rolling annualised Sharpe ratio for every column of a return matrix.
+
+    Uses bottleneck's O(T·S) ``move_mean`` / ``move_std`` when installed,
+    otherwise window sums from one cumulative sum per moment (same cost).
+    Matches pandas ``rolling(window).mean() / rolling(window).std()``
+    (ddof=1); the first ``window - 1`` rows are NaN.
+
+    Parameters
+    ----------
+    returns : np.ndarray
+        Daily returns, shape (T,) or (T, S). NaN marks dates a strategy
+        does not cover; windows containing NaN yield NaN.
+    window : int
+        Rolling window in trading days (>= 2).
+    risk_free_rate : float
+        Annualised risk-free rate.
+
+    Returns
+    -------
+    np.ndarray
+        Same shape as ``returns``.
+    """
+    if window < 2:
+        raise ValueError(f"window must be >= 2, got {window}")
+
+    x = np.asarray(returns, dtype=float)
+    excess = x.reshape(len(x), -1) - risk_free_rate / TRADING_DAYS
+    out = np.full_like(excess, np.nan)
+
+    if bn is not None and len(excess) >= window:
+        mean = bn.move_mean(excess, window, min_count=window, axis=0)
+        std = bn.move_std(excess, window, min_count=window, axis=0, ddof=1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            out = mean / std * np.sqrt(TRADING_DAYS)
+
+    elif len(excess) >= window:
+        # Centre each column first so the sum-of-squares variance is stable;
+        # NaN contributes zero to the sums and is tracked by a valid count
+        valid = ~np.isnan(excess)
+        filled = np.where(valid, excess, 0.0)
+        col_mean = filled.sum(axis=0) / np.maximum(valid.sum(axis=0), 1)
+        centred = np.where(valid, filled - col_mean, 0.0)
+        zero = np.zeros((1, centred.shape[1]))
+        c0 = np.concatenate([zero, np.cumsum(valid, axis=0)])
+        c1 = np.concatenate([zero, np.cumsum(centred, axis=0)])
+        c2 = np.concatenate([zero, np.cumsum(centred * centred, axis=0)])
+
+        full = (c0[window:] - c0[:-window]) == window
+        s1 = c1[window:] - c1[:-window]
+        s2 = c2[window:] - c2[:-window]
+        var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = (s1 / window + col_mean) / np.sqrt(var) * np.sqrt(TRADING_DAYS)
+        out[window - 1 :] = np.where(full, sharpe, np.nan)
+
+    return out.reshape(x.shape)
+
+
+def drawdowns(equity: np.ndarray) -> np.ndarray:
+    """
+    Fractional drawdown from the running peak (<= 0) for every column.
+
+    Parameters
+    ----------
+    equity : np.ndarray
+        Equity curves, shape (T,) or (T, S). NaN (dates a strategy does not
+        cover) stays NaN and does not reset the running peak.
+
+    Returns
+    -------
+    np.ndarray
+        Same shape as ``equity``.
+    """
+    equity = np.asarray(equity, dtype=float)
+    peak = np.fmax.accumulate(equity, axis=0)
+    return equity / peak - 1.0
+
+
 # ---------------------------------------------------------------------------
 # Composite report
 # ---------------------------------------------------------------------------
@@ -20,6 +20,8 @@ import numpy as np
 import pandas as pd
 
 import config
+from src.engine.backtest import BacktestBundle
+from src.risk.metrics import drawdowns, rolling_sharpe
 
 CHART_DIR = Path(config.CHART_DIR)
 DPI = config.CHART_DPI
@@ -94,31 +96,37 @@ def plot_equity_curves(
 
 
 def plot_monte_carlo_fan(
-    equity_paths: np.ndarray,
+    equity_paths: np.ndarray | None,
     initial_capital: float,
     filename: str = "monte_carlo_fan.png",
+    fan_percentiles: np.ndarray | None = None,
 ) -> Path:
     """
     Plot Monte Carlo equity path fan with percentile bands.
 
     Parameters
     ----------
-    equity_paths : np.ndarray
-        Shape (n_paths, n_days+1). Requires store_paths=True.
+    equity_paths : np.ndarray or None
+        Shape (n_paths, n_days+1). Requires store_paths=True. Any float
+        dtype is accepted (the simulator stores float32 paths). May be None
+        when ``fan_percentiles`` is given.
     initial_capital : float
         Starting value for normalisation baseline.
     filename : str
         Output file name.
+    fan_percentiles : np.ndarray or None
+        Precomputed 5th/25th/50th/75th/95th percentile curves, shape
+        (5, n_days+1) — ``MonteCarloResult.fan_percentiles`` from the
+        streaming simulator. Takes precedence over ``equity_paths``.
     """
-    # Normalise to multiples of initial capital
-    norm = equity_paths / initial_capital
-    days = np.arange(norm.shape[1])
+    if fan_percentiles is None:
+        if equity_paths is None:
+            raise ValueError("Provide equity_paths or fan_percentiles")
+        fan_percentiles = np.percentile(equity_paths, [5, 25, 50, 75, 95], axis=0)
 
-    p5 = np.percentile(norm, 5, axis=0)
-    p25 = np.percentile(norm, 25, axis=0)
-    p50 = np.percentile(norm, 50, axis=0)
-    p75 = np.percentile(norm, 75, axis=0)
-    p95 = np.percentile(norm, 95, axis=0)
+    # Normalise to multiples of initial capital
+    p5, p25, p50, p75, p95 = np.asarray(fan_percentiles) / initial_capital
+    days = np.arange(len(p50))
 
     fig, ax = plt.subplots(figsize=(12, 6))
 
@@ -152,8 +160,24 @@ def plot_monte_carlo_fan(
 # ---------------------------------------------------------------------------
 
 
+def _stack_series(
+    data: dict[str, pd.Series] | BacktestBundle, field: str
+) -> tuple[pd.DatetimeIndex, list[str], np.ndarray]:
+    """
+    (dates, names, (T, S) matrix) for a chart input.
+
+    A bundle's ``field`` matrix is used as-is; a name → Series dict is
+    aligned on the union of its dates like ``bundle_results``, so every
+    strategy keeps its own range (NaN elsewhere).
+    """
+    if isinstance(data, BacktestBundle):
+        return data.dates, data.names, getattr(data, field)
+    frame = pd.concat(list(data.values()), axis=1, keys=list(data))
+    return pd.DatetimeIndex(frame.index), list(data), frame.to_numpy(dtype=float)
+
+
 def plot_rolling_sharpe(
-    returns_dict: dict[str, pd.Series],
+    returns_dict: dict[str, pd.Series] | BacktestBundle,
     window: int = config.ROLLING_SHARPE_WINDOW,
     risk_free_rate: float = config.RISK_FREE_RATE,
     filename: str = "rolling_sharpe.png",
@@ -163,8 +187,9 @@ def plot_rolling_sharpe(
 
     Parameters
     ----------
-    returns_dict : dict[str, pd.Series]
-        Strategy name → daily returns Series.
+    returns_dict : dict[str, pd.Series] or BacktestBundle
+        Strategy name → daily returns Series, or a bundle (see
+        ``bundle_results``). Each strategy is drawn over its own date range.
     window : int
         Rolling window in trading days.
     risk_free_rate : float
@@ -180,13 +205,13 @@ def plot_rolling_sharpe(
         "Equal Weight": COLORS["equal_weight"],
     }
 
-    for name, returns in returns_dict.items():
-        excess = returns - risk_free_rate / 252
-        rolling = (
-            excess.rolling(window).mean() / excess.rolling(window).std() * np.sqrt(252)
-        )
+    # All strategies in one (T, S) pass rather than one rolling object each
+    dates, names, returns = _stack_series(returns_dict, "returns")
+    sharpe = rolling_sharpe(returns, window, risk_free_rate)
+
+    for col, name in enumerate(names):
         color = color_map.get(name, "#607D8B")
-        ax.plot(rolling.index, rolling, label=name, color=color, linewidth=1.4)
+        ax.plot(dates, sharpe[:, col], label=name, color=color, linewidth=1.4)
 
     ax.axhline(0.0, color="#9E9E9E", linewidth=0.8, linestyle="--")
     ax.set_title(f"Rolling {window}-Day Sharpe Ratio", fontsize=14, fontweight="bold")
@@ -204,7 +229,7 @@ def plot_rolling_sharpe(
 
 
 def plot_drawdowns(
-    results: dict[str, pd.Series],
+    results: dict[str, pd.Series] | BacktestBundle,
     filename: str = "drawdowns.png",
 ) -> Path:
     """
@@ -212,8 +237,9 @@ def plot_drawdowns(
 
     Parameters
     ----------
-    results : dict[str, pd.Series]
-        Strategy name → equity curve Series.
+    results : dict[str, pd.Series] or BacktestBundle
+        Strategy name → equity curve Series, or a bundle (see
+        ``bundle_results``). Each strategy is drawn over its own date range.
     filename : str
         Output file name.
     """
@@ -225,12 +251,13 @@ def plot_drawdowns(
         "Equal Weight": COLORS["equal_weight"],
     }
 
-    for name, equity in results.items():
-        peak = equity.cummax()
-        dd = (equity - peak) / peak * 100
+    dates, names, equity = _stack_series(results, "equity")
+    dd = drawdowns(equity) * 100
+
+    for col, name in enumerate(names):
         color = color_map.get(name, "#607D8B")
-        ax.fill_between(dd.index, dd, 0, alpha=0.25, color=color)
-        ax.plot(dd.index, dd, label=name, color=color, linewidth=1.2)
+        ax.fill_between(dates, dd[:, col], 0, alpha=0.25, color=color)
+        ax.plot(dates, dd[:, col], label=name, color=color, linewidth=1.2)
 
     ax.set_title("Portfolio Drawdown from Peak", fontsize=14, fontweight="bold")
     ax.set_xlabel("Date")
@@ -7,7 +7,7 @@ import pytest
 
 @pytest.fixture
 def sample_prices() -> pd.DataFrame:
-    """Generate synthetic price data for 3 assets over 252 trading days."""
+    """Generate synthetic float32 price data for 3 assets over 252 trading days."""
     np.random.seed(42)
     dates = pd.bdate_range("2020-01-01", periods=252)
     tickers = ["AAA", "BBB", "CCC"]
@@ -17,7 +17,7 @@ def sample_prices() -> pd.DataFrame:
         daily_returns = np.random.normal(0.05 / 252, 0.20 / np.sqrt(252), 252)
         prices = 100.0 * np.exp(np.cumsum(daily_returns))
         data[ticker] = prices
-    return pd.DataFrame(data, index=dates)
+    return pd.DataFrame(data, index=dates).astype(np.float32)
 
 
 @pytest.fixture
@@ -8,9 +8,9 @@ import pytest
 
 from src.engine.backtest import (
     BacktestResult,
-    PortfolioState,
+    _rebalance_mask,
+    bundle_results,
     run_backtest,
-    _should_rebalance,
 )
 from src.engine.costs import TransactionCostModel
 
@@ -42,59 +42,32 @@ def zero_weight_signal(date, prices, current_weights):
 # ---------------------------------------------------------------------------
 
 
-class TestPortfolioState:
-
-    def test_weights_with_holdings(self):
-        state = PortfolioState(
-            cash=0.0,
-            holdings=pd.Series({"A": 600.0, "B": 400.0}),
-        )
-        state.update_equity()
-        w = state.weights()
-        assert abs(w["A"] - 0.6) < 1e-10
-        assert abs(w["B"] - 0.4) < 1e-10
-
-    def test_weights_zero_equity(self):
-        state = PortfolioState(
-            cash=0.0,
-            holdings=pd.Series({"A": 0.0, "B": 0.0}),
-        )
-        state.update_equity()
-        w = state.weights()
-        assert (w == 0.0).all()
-
-    def test_equity_includes_cash(self):
-        state = PortfolioState(
-            cash=100_000.0,
-            holdings=pd.Series({"A": 500_000.0, "B": 400_000.0}),
-        )
-        state.update_equity()
-        assert abs(state.equity - 1_000_000.0) < 1e-10
-
-
-class TestShouldRebalance:
+class TestRebalanceMask:
 
     def test_daily_always_true(self):
-        d = pd.Timestamp("2020-06-15")
-        assert _should_rebalance(d, pd.Timestamp("2020-06-12"), "daily") is True
+        dates = pd.DatetimeIndex(["2020-06-12", "2020-06-15", "2020-06-16"])
+        assert _rebalance_mask(dates, "daily").all()
 
     def test_monthly_same_month(self):
-        d = pd.Timestamp("2020-06-15")
-        prev = pd.Timestamp("2020-06-12")
-        assert _should_rebalance(d, prev, "monthly") is False
+        dates = pd.DatetimeIndex(["2020-06-12", "2020-06-15"])
+        assert not _rebalance_mask(dates, "monthly")[1]
 
     def test_monthly_new_month(self):
-        d = pd.Timestamp("2020-07-01")
-        prev = pd.Timestamp("2020-06-30")
-        assert _should_rebalance(d, prev, "monthly") is True
+        dates = pd.DatetimeIndex(["2020-06-30", "2020-07-01"])
+        assert _rebalance_mask(dates, "monthly")[1]
 
     def test_monthly_first_day(self):
-        d = pd.Timestamp("2020-01-02")
-        assert _should_rebalance(d, None, "monthly") is True
+        dates = pd.DatetimeIndex(["2020-01-02", "2020-01-03"])
+        assert _rebalance_mask(dates, "monthly")[0]
+
+    def test_monthly_one_per_month(self):
+        dates = pd.bdate_range("2020-01-01", periods=300)
+        mask = _rebalance_mask(dates, "monthly")
+        assert mask.sum() == dates.to_period("M").nunique()
 
     def test_unknown_freq_raises(self):
         with pytest.raises(ValueError, match="Unknown rebalance"):
-            _should_rebalance(pd.Timestamp("2020-01-01"), None, "weekly")
+            _rebalance_mask(pd.bdate_range("2020-01-01", periods=5), "weekly")
 
 
 class TestRunBacktest:
@@ -200,6 +173,61 @@ class TestRunBacktest:
         assert isinstance(result.max_drawdown, float)
         assert result.max_drawdown <= 0.0  # drawdown is always negative or zero
 
+    def test_single_asset_tracks_price_without_costs(self):
+        """Fully invested in one asset, equity is exactly capital × price relative."""
+        prices = self._make_prices(n_days=120, n_assets=2)
+        result = run_backtest(
+            prices,
+            single_asset_signal,
+            initial_capital=1_000_000,
+            rebalance_freq="monthly",
+            cost_model=TransactionCostModel(cost_bps=0, slippage_bps=0),
+        )
+        expected = 1_000_000 * prices.iloc[:, 0] / prices.iloc[0, 0]
+        np.testing.assert_allclose(
+            result.equity_curve.values, expected.values, rtol=1e-12
+        )
+
+    def test_trading_cost_override_is_honoured(self):
+        """A fixed-fee subclass is charged in dollars, not as a cost rate."""
+
+        class FixedFee(TransactionCostModel):
+            def trading_cost(self, trade_weights, portfolio_value):
+                return 1_000.0 if np.abs(trade_weights).sum() > 0 else 0.0
+
+        prices = self._make_prices(n_days=120, n_assets=2)
+        result = run_backtest(
+            prices,
+            single_asset_signal,
+            initial_capital=1_000_000,
+            rebalance_freq="monthly",
+            cost_model=FixedFee(),
+        )
+        # Only the opening trade moves weights; it pays the flat fee once
+        assert result.total_costs.sum() == pytest.approx(1_000.0)
+        expected = 999_000 * prices.iloc[:, 0] / prices.iloc[0, 0]
+        np.testing.assert_allclose(
+            result.equity_curve.values, expected.values, rtol=1e-12
+        )
+
+    def test_log_returns_passed_to_opt_in_signals(self):
+        prices = self._make_prices(n_days=60)
+        seen: list[tuple[pd.Timestamp, pd.DataFrame]] = []
+
+        def recording_signal(date, prices, current_weights, log_returns=None):
+            seen.append((date, log_returns))
+            return equal_weight_signal(date, prices, current_weights)
+
+        recording_signal.accepts_log_returns = True
+        run_backtest(prices, recording_signal, rebalance_freq="monthly")
+
+        assert len(seen) >= 2
+        for date, log_returns in seen:
+            assert log_returns is not None
+            assert len(log_returns) == prices.index.get_loc(date)
+            if len(log_returns):
+                assert log_returns.index[-1] == date
+
     def test_positions_sum_to_approximately_one(self):
         """On rebalance days, weights should sum to ~1 for fully invested."""
         prices = self._make_prices()
@@ -211,3 +239,37 @@ class TestRunBacktest:
         )
         weight_sums = result.positions.sum(axis=1)
         np.testing.assert_allclose(weight_sums.values, 1.0, atol=1e-6)
+
+
+class TestBundleResults:
+
+    def test_stacks_strategies_column_wise(self):
+        prices = TestRunBacktest()._make_prices(n_days=60)
+        results = {
+            "EW": run_backtest(prices, equal_weight_signal, rebalance_freq="monthly"),
+            "One": run_backtest(prices, single_asset_signal, rebalance_freq="monthly"),
+        }
+        bundle = bundle_results(results)
+
+        assert bundle.names == ["EW", "One"]
+        assert bundle.returns.shape == bundle.equity.shape == (60, 2)
+        np.testing.assert_array_equal(
+            bundle.equity[:, 1], results["One"].equity_curve.to_numpy()
+        )
+        assert bundle.dates.equals(results["EW"].equity_curve.index)
+
+    def test_keeps_each_strategy_date_range(self):
+        prices = TestRunBacktest()._make_prices(n_days=60)
+        full = run_backtest(prices, equal_weight_signal)
+        short = run_backtest(prices.iloc[20:], equal_weight_signal)
+        bundle = bundle_results({"full": full, "short": short})
+        assert len(bundle.dates) == 60
+        np.testing.assert_array_equal(bundle.equity[:, 0], full.equity_curve.to_numpy())
+        assert np.isnan(bundle.equity[:20, 1]).all()
+        np.testing.assert_array_equal(
+            bundle.equity[20:, 1], short.equity_curve.to_numpy()
+        )
+
+    def test_empty_raises(self):
+        with pytest.raises(ValueError, match="No backtest results"):
+            bundle_results({})
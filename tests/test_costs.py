@@ -77,6 +77,25 @@ class TestTurnover:
         assert abs(model.turnover(trades) - 0.10) < 1e-10
 
 
+class TestRebalanceCosts:
+    """Tests for the batched rebalance_costs."""
+
+    def test_matches_per_row_methods(self):
+        model = TransactionCostModel(cost_bps=10, slippage_bps=5)
+        trades = np.random.default_rng(0).normal(0, 0.1, (6, 4))
+        turnover, cost_fraction = model.rebalance_costs(trades)
+        for row, to, cf in zip(trades, turnover, cost_fraction):
+            assert to == pytest.approx(model.turnover(row))
+            assert cf == pytest.approx(model.trading_cost(row, 1.0))
+
+    def test_zero_trades(self):
+        turnover, cost_fraction = TransactionCostModel().rebalance_costs(
+            np.zeros((3, 2))
+        )
+        np.testing.assert_array_equal(turnover, 0.0)
+        np.testing.assert_array_equal(cost_fraction, 0.0)
+
+
 class TestNetReturnAfterCosts:
     """Tests for net_return_after_costs."""
 
@@ -9,8 +9,10 @@ import pytest
 from src.optimization.covariance import (
     EWMACovariance,
     LedoitWolfCovariance,
+    RollingCovariance,
     SampleCovariance,
     get_covariance_estimator,
+    ledoit_wolf_fast,
 )
 
 # ---------------------------------------------------------------------------
@@ -126,6 +128,22 @@ class TestLedoitWolfCovariance:
         cond_lw = np.linalg.cond(lw_cov)
         assert cond_lw < cond_sample
 
+    def test_matches_sklearn(self):
+        from sklearn.covariance import LedoitWolf
+
+        returns = _make_returns(n_days=252, n_assets=12, seed=3)
+        expected = LedoitWolf().fit(returns.values).covariance_
+        np.testing.assert_allclose(
+            ledoit_wolf_fast(returns.values), expected, rtol=1e-10, atol=1e-16
+        )
+
+    def test_preserves_float32(self):
+        returns = _make_returns(n_days=252, n_assets=5)
+        x32 = returns.values.astype(np.float32)
+        cov = ledoit_wolf_fast(x32)
+        assert cov.dtype == np.float32
+        np.testing.assert_allclose(cov, ledoit_wolf_fast(returns.values), rtol=1e-4)
+
 
 class TestEWMACovariance:
 
@@ -149,8 +167,87 @@ class TestEWMACovariance:
         assert diff_high < diff_low
 
 
+class TestRollingCovariance:
+
+    def test_shifted_windows_match_batch(self):
+        returns = _make_returns(n_days=600, n_assets=6, seed=5)
+        sample, shrunk = RollingCovariance(), RollingCovariance(shrink=True)
+        for end in range(252, 600, 21):
+            window = returns.iloc[end - 252 : end]
+            np.testing.assert_allclose(
+                sample.estimate(window).values, window.cov().values, rtol=1e-9
+            )
+            np.testing.assert_allclose(
+                shrunk.estimate(window).values,
+                ledoit_wolf_fast(window.values),
+                rtol=1e-9,
+            )
+        assert sample.n == 252
+
+    def test_expanding_window_matches_batch(self):
+        returns = _make_returns(n_days=400, n_assets=4)
+        est = RollingCovariance(shrink=True)
+        for end in (100, 150, 400):
+            window = returns.iloc[:end]
+            np.testing.assert_allclose(
+                est.estimate(window).values, ledoit_wolf_fast(window.values), rtol=1e-9
+            )
+
+    def test_non_overlapping_window_rebuilds(self):
+        returns = _make_returns(n_days=500, n_assets=3)
+        est = RollingCovariance()
+        est.estimate(returns.iloc[:100])
+        later = returns.iloc[300:400]
+        np.testing.assert_allclose(
+            est.estimate(later).values, later.cov().values, rtol=1e-9
+        )
+        # Same dates, different values → must not reuse stale sums
+        scaled = later * 3.0
+        np.testing.assert_allclose(
+            est.estimate(scaled).values, scaled.cov().values, rtol=1e-9
+        )
+
+    def test_shift_with_edited_interior_rebuilds(self):
+        """Matching dates but a changed overlapping row must not reuse sums."""
+        returns = _make_returns(n_days=300, n_assets=4)
+        est = RollingCovariance(shrink=True)
+        est.estimate(returns.iloc[0:252])
+
+        edited = returns.copy()
+        edited.iloc[100] *= 10.0
+        window = edited.iloc[21:273]
+        np.testing.assert_allclose(
+            est.estimate(window).values,
+            ledoit_wolf_fast(window.values),
+            rtol=1e-9,
+        )
+
+    def test_update_adds_and_removes_rows(self):
+        returns = _make_returns(n_days=60, n_assets=3).values
+        est = RollingCovariance()
+        for row in returns[:50]:
+            est.update(row)
+        for i in range(50, 60):
+            cov = est.update(returns[i], row_out=returns[i - 50])
+        np.testing.assert_allclose(cov, np.cov(returns[10:60].T), rtol=1e-9)
+
+    def test_single_observation_is_nan(self):
+        est = RollingCovariance()
+        cov = est.update(np.array([0.01, 0.02]))
+        assert cov.shape == (2, 2)
+        assert np.isnan(cov).all()
+
+
 class TestFactory:
 
+    def test_rolling_variants(self):
+        sample = get_covariance_estimator("sample", rolling=True)
+        assert isinstance(sample, RollingCovariance) and not sample.shrink
+        lw = get_covariance_estimator("ledoit_wolf", rolling=True)
+        assert isinstance(lw, RollingCovariance) and lw.shrink
+        ewma = get_covariance_estimator("ewma", rolling=True)
+        assert isinstance(ewma, EWMACovariance)
+
     def test_get_sample(self):
         est = get_covariance_estimator("sample")
         assert isinstance(est, SampleCovariance)
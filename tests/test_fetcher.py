@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import tempfile
+import time
 from pathlib import Path
 from unittest.mock import patch
 
 import numpy as np
 import pandas as pd
+import pyarrow.parquet as pq
 import pytest
 
 import config
@@ -69,6 +71,23 @@ class TestFetchSingle:
                 result1, result2, check_names=False, check_freq=False
             )
 
+    def test_cache_hit_restores_index_and_name(self, tmp_path: Path):
+        dates = pd.bdate_range("2020-01-01", periods=20)
+        prices = pd.Series(np.linspace(100, 120, 20), index=dates, name="Close")
+
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch("src.data.fetcher.yf.download", _make_mock_download(prices)),
+        ):
+            fetcher.fetch_single("BTC-USD", use_cache=True)
+            cached = fetcher.fetch_single("BTC-USD", use_cache=True)
+
+        assert cached.name == "BTC-USD"
+        assert isinstance(cached.index, pd.DatetimeIndex)
+        assert cached.index.name == "Date"
+        meta = pq.ParquetFile(tmp_path / "BTC-USD.parquet").metadata
+        assert meta.row_group(0).column(0).compression == "ZSTD"
+
     def test_raises_on_empty_data(self, tmp_path: Path):
         def mock_empty(*args, **kwargs):
             return pd.DataFrame()
@@ -132,6 +151,50 @@ class TestFetchPrices:
         assert "ALSO_GOOD" in result.columns
         assert "BAD" not in result.columns
 
+    def test_preserves_ticker_order_with_concurrent_fetch(self, tmp_path: Path):
+        """Columns follow the requested order even if downloads finish out of order."""
+        dates = pd.bdate_range("2020-01-01", periods=30)
+        delays = {"SLOW": 0.2, "MID": 0.1, "FAST": 0.0}
+
+        def mock_download(ticker, **kwargs):
+            time.sleep(delays[ticker])
+            prices = pd.Series(np.linspace(100, 110, 30), index=dates, name="Close")
+            return pd.DataFrame({"Close": prices})
+
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch("src.data.fetcher.yf.download", mock_download),
+        ):
+            result = fetcher.fetch_prices(
+                tickers=["SLOW", "MID", "FAST"], use_cache=False
+            )
+
+        assert list(result.columns) == ["SLOW", "MID", "FAST"]
+
+    def test_downloads_never_overlap(self, tmp_path: Path):
+        """yf.download shares global state, so calls must not run concurrently."""
+        dates = pd.bdate_range("2020-01-01", periods=30)
+        active = [0]
+        overlaps = []
+
+        def mock_download(ticker, **kwargs):
+            active[0] += 1
+            overlaps.append(active[0] > 1)
+            time.sleep(0.02)
+            active[0] -= 1
+            prices = pd.Series(np.linspace(100, 110, 30), index=dates, name="Close")
+            return pd.DataFrame({"Close": prices})
+
+        tickers = [f"T{i}" for i in range(8)]
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch("src.data.fetcher.yf.download", mock_download),
+        ):
+            result = fetcher.fetch_prices(tickers=tickers, use_cache=False)
+
+        assert list(result.columns) == tickers
+        assert len(overlaps) == len(tickers) and not any(overlaps)
+
     def test_raises_when_all_fail(self, tmp_path: Path):
         def mock_download(ticker, **kwargs):
             return pd.DataFrame()
@@ -163,6 +226,65 @@ class TestFetchPrices:
 
         # After ffill(limit=5), no NaNs should remain
         assert not result.isna().any().any()
+        assert (result.dtypes == config.PRICE_DTYPE).all()
+
+
+class TestMatrixCache:
+    """Tests for the aligned price-matrix cache in fetch_prices()."""
+
+    def _mock_download(self, ticker, **kwargs):
+        dates = pd.bdate_range("2020-01-01", periods=40)
+        prices = pd.Series(np.linspace(100, 140, 40), index=dates, name="Close")
+        return pd.DataFrame({"Close": prices})
+
+    @pytest.mark.parametrize("fmt", ["feather", "parquet"])
+    def test_second_call_reads_matrix_only(self, tmp_path: Path, fmt: str):
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch.object(config, "CACHE_FORMAT", fmt),
+            patch("src.data.fetcher.yf.download", self._mock_download),
+        ):
+            first = fetcher.fetch_prices(tickers=["A", "B"], use_cache=True)
+
+        assert len(list(tmp_path.glob(f"matrix_*.{fmt}"))) == 1
+
+        def fail(*args, **kwargs):
+            raise AssertionError("per-ticker fetch should not run on matrix hit")
+
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch.object(config, "CACHE_FORMAT", fmt),
+            patch("src.data.fetcher.fetch_single", fail),
+        ):
+            second = fetcher.fetch_prices(tickers=["A", "B"], use_cache=True)
+
+        pd.testing.assert_frame_equal(first, second, check_freq=False)
+
+    def test_hit_respects_requested_order(self, tmp_path: Path):
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch("src.data.fetcher.yf.download", self._mock_download),
+        ):
+            fetcher.fetch_prices(tickers=["A", "B"], use_cache=True)
+            result = fetcher.fetch_prices(tickers=["B", "A"], use_cache=True)
+
+        assert list(result.columns) == ["B", "A"]
+
+    def test_unknown_format_raises(self, tmp_path: Path):
+        with (
+            patch.object(config, "CACHE_DIR", str(tmp_path)),
+            patch.object(config, "CACHE_FORMAT", "hdf5"),
+        ):
+            with pytest.raises(ValueError, match="cache format"):
+                fetcher._matrix_cache_path(["A"], "2020-01-01", "2021-01-01")
+
+    def test_key_depends_on_dates(self, tmp_path: Path):
+        with patch.object(config, "CACHE_DIR", str(tmp_path)):
+            a = fetcher._matrix_cache_path(["A", "B"], "2020-01-01", "2021-01-01")
+            b = fetcher._matrix_cache_path(["B", "A"], "2020-01-01", "2021-01-01")
+            c = fetcher._matrix_cache_path(["A", "B"], "2020-01-01", "2022-01-01")
+        assert a == b
+        assert a != c
 
 
 class TestClearCache:
@@ -179,6 +301,40 @@ class TestClearCache:
         assert count == 2
         assert list(tmp_path.glob("*.parquet")) == []
 
+    def test_clears_feather_matrix(self, tmp_path: Path):
+        (tmp_path / "A.parquet").write_text("fake")
+        (tmp_path / "matrix_abc.feather").write_text("fake")
+
+        with patch.object(config, "CACHE_DIR", str(tmp_path)):
+            assert fetcher.clear_cache() == 2
+
     def test_returns_zero_when_no_cache(self, tmp_path: Path):
         with patch.object(config, "CACHE_DIR", str(tmp_path / "nonexistent")):
             assert fetcher.clear_cache() == 0
+
+
+class TestFfillDropna:
+
+    def test_matches_pandas(self):
+        rng = np.random.default_rng(7)
+        arr = rng.uniform(50, 150, (200, 4))
+        arr[rng.random(arr.shape) < 0.15] = np.nan
+        arr[:3, 1] = np.nan  # leading gap can never be filled
+        arr[50:58, 2] = np.nan  # gap longer than the limit
+        idx = pd.bdate_range("2020-01-01", periods=200, name="Date")
+        prices = pd.DataFrame(arr, index=idx, columns=list("ABCD"))
+
+        expected = prices.ffill(limit=5).dropna()
+        result = fetcher._ffill_dropna(prices, limit=5)
+
+        pd.testing.assert_frame_equal(result, expected)
+
+    def test_limit_respected(self):
+        idx = pd.bdate_range("2020-01-01", periods=8, name="Date")
+        prices = pd.DataFrame(
+            {"A": [1.0] + [np.nan] * 6 + [2.0], "B": np.arange(8.0)}, index=idx
+        )
+        result = fetcher._ffill_dropna(prices, limit=5)
+        # Rows 1-5 filled, row 6 exceeds the limit and is dropped
+        assert list(result.index) == list(idx[[0, 1, 2, 3, 4, 5, 7]])
+        assert result["A"].iloc[5] == 1.0
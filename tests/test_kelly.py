@@ -6,7 +6,9 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.optimization.kelly import kelly_weights
+from src.data.returns import compute_log_returns
+from src.optimization.covariance import get_covariance_estimator
+from src.optimization.kelly import _solve_kelly, kelly_weights
 
 
 class TestKellyBasic:
@@ -175,3 +177,68 @@ class TestKellySingularCovariance:
         w = kelly_weights(mu, cov, risk_free_rate=0.04, fraction=0.5)
         assert np.isfinite(w).all()
         assert (w >= 0).all()
+
+    def test_cholesky_matches_linear_solve(self):
+        """SPD path agrees with a plain LU solve."""
+        rng = np.random.default_rng(0)
+        a = rng.standard_normal((12, 12))
+        cov = a @ a.T / 12 + 0.01 * np.eye(12)
+        excess = rng.uniform(0.01, 0.1, 12)
+        np.testing.assert_allclose(
+            _solve_kelly(cov, excess), np.linalg.solve(cov, excess), rtol=1e-10
+        )
+
+    def test_indefinite_matrix_falls_back(self):
+        """Non-PD input (Cholesky fails) still returns the exact solution."""
+        cov = np.array([[1.0, 2.0], [2.0, 1.0]])
+        excess = np.array([0.05, 0.02])
+        np.testing.assert_allclose(
+            _solve_kelly(cov, excess), np.linalg.solve(cov, excess)
+        )
+
+
+class TestKellyFloat32:
+
+    @staticmethod
+    def _weights(prices, method, fraction, **caps):
+        returns = compute_log_returns(prices)
+        cov = get_covariance_estimator(method).estimate(returns) * 252
+        mu = returns.mean() * 252
+        w = kelly_weights(mu, cov, risk_free_rate=0.0, fraction=fraction, **caps)
+        return w.to_numpy()
+
+    @pytest.mark.parametrize("method", ["ledoit_wolf", "ewma"])
+    @pytest.mark.parametrize("fraction", [0.5, 1.0])
+    def test_float32_prices_match_float64(self, method, fraction):
+        """
+        Kelly from float32 prices matches float64 prices.
+
+        Uncapped weights (up to ~9x gross) agree to rtol 1e-5 — the worst
+        observed is ~7.5e-6, from float32 price quantisation; the statistics
+        themselves run in float64. With the default caps the weights match.
+        """
+        rng = np.random.default_rng(3)
+        n_days, n_assets = 756, 12
+        daily = rng.multivariate_normal(
+            np.linspace(1e-4, 3e-4, n_assets),
+            np.eye(n_assets) * 1e-4 + 2e-5,
+            n_days,
+        )
+        prices = pd.DataFrame(
+            100.0 * np.exp(np.cumsum(daily, axis=0)),
+            index=pd.bdate_range("2020-01-01", periods=n_days),
+            columns=[f"T{i}" for i in range(n_assets)],
+        )
+        p64, p32 = prices, prices.astype(np.float32)
+
+        uncapped = {"max_weight": np.inf, "max_leverage": np.inf}
+        w64 = self._weights(p64, method, fraction, **uncapped)
+        w32 = self._weights(p32, method, fraction, **uncapped)
+        assert (w64 > 0).sum() >= 4
+        np.testing.assert_allclose(w32, w64, rtol=1e-5)
+
+        np.testing.assert_allclose(
+            self._weights(p32, method, fraction),
+            self._weights(p64, method, fraction),
+            atol=1e-12,
+        )
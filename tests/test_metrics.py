@@ -6,14 +6,17 @@ import numpy as np
 import pandas as pd
 import pytest
 
+from src.risk import metrics
 from src.risk.metrics import (
     annualized_return,
     annualized_volatility,
     calmar_ratio,
     compute_risk_report,
     conditional_var,
+    drawdowns,
     max_drawdown,
     profit_factor,
+    rolling_sharpe,
     sharpe_ratio,
     sortino_ratio,
     value_at_risk,
@@ -193,6 +196,69 @@ class TestProfitFactor:
         assert abs(profit_factor(ret) - 4.0) < 1e-10
 
 
+class TestRollingSharpe:
+    @pytest.fixture(params=["bottleneck", "cumsum"])
+    def backend(self, request, monkeypatch):
+        if request.param == "bottleneck":
+            pytest.importorskip("bottleneck")
+        else:
+            monkeypatch.setattr(metrics, "bn", None)
+        return request.param
+
+    def test_matches_pandas_per_column(self, backend):
+        rng = np.random.default_rng(0)
+        frame = pd.DataFrame(rng.normal(0.0005, 0.01, (400, 3)))
+        result = rolling_sharpe(frame.to_numpy(), window=60, risk_free_rate=0.04)
+
+        excess = frame - 0.04 / 252
+        expected = excess.rolling(60).mean() / excess.rolling(60).std() * np.sqrt(252)
+        np.testing.assert_allclose(result, expected.to_numpy(), rtol=1e-8)
+
+    def test_1d_input_keeps_shape(self, backend):
+        ret = _random_returns(100).to_numpy()
+        result = rolling_sharpe(ret, window=20)
+        assert result.shape == (100,)
+        assert np.isnan(result[:19]).all()
+        assert np.isfinite(result[19:]).all()
+
+    def test_series_shorter_than_window_all_nan(self, backend):
+        assert np.isnan(rolling_sharpe(np.zeros((10, 2)) + 0.01, window=20)).all()
+
+    def test_nan_range_matches_own_column(self, backend):
+        rng = np.random.default_rng(1)
+        ret = rng.normal(0.0005, 0.01, (300, 2))
+        ret[:50, 1] = np.nan  # second strategy starts later
+        result = rolling_sharpe(ret, window=40)
+        np.testing.assert_allclose(
+            result[:, 0], rolling_sharpe(ret[:, 0], window=40), rtol=1e-8
+        )
+        assert np.isnan(result[: 50 + 39, 1]).all()
+        np.testing.assert_allclose(
+            result[50:, 1], rolling_sharpe(ret[50:, 1], window=40), rtol=1e-8
+        )
+
+    def test_window_too_small_raises(self):
+        with pytest.raises(ValueError, match="window"):
+            rolling_sharpe(np.zeros(10), window=1)
+
+
+class TestDrawdowns:
+    def test_matches_max_drawdown(self):
+        rets = [_random_returns(seed=s) for s in (1, 2)]
+        equity = np.column_stack([(1.0 + r).cumprod() for r in rets])
+        dd = drawdowns(equity)
+        assert (dd <= 0).all()
+        for col, r in enumerate(rets):
+            assert dd[:, col].min() == pytest.approx(max_drawdown(r))
+
+    def test_leading_nan_ignored(self):
+        equity = np.array([[1.0, np.nan], [1.2, np.nan], [0.9, 2.0], [1.0, 1.5]])
+        dd = drawdowns(equity)
+        assert np.isnan(dd[:2, 1]).all()
+        np.testing.assert_allclose(dd[2:, 1], [0.0, -0.25])
+        np.testing.assert_allclose(dd[:, 0], [0.0, 0.0, -0.25, -1 / 6])
+
+
 class TestRiskReport:
     def test_all_fields_finite(self):
         ret = _random_returns()
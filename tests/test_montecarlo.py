@@ -6,7 +6,13 @@ import numpy as np
 import pandas as pd
 import pytest
 
-from src.monte_carlo.simulation import MonteCarloResult, run_monte_carlo
+from src.monte_carlo.simulation import (
+    FAN_PERCENTILES,
+    MonteCarloResult,
+    run_monte_carlo,
+    run_monte_carlo_multivariate,
+    run_monte_carlo_streaming,
+)
 
 
 def _sample_returns(n: int = 500, seed: int = 42) -> pd.Series:
@@ -83,6 +89,25 @@ class TestMonteCarloStats:
         result = run_monte_carlo(ret, n_paths=500, n_days=252, seed=42)
         assert (result.terminal_wealth > 0).all()
 
+    def test_drawdowns_match_stored_paths(self):
+        """Log-space drawdowns agree with drawdowns of the stored equity curves."""
+        ret = _sample_returns()
+        result = run_monte_carlo(ret, n_paths=200, n_days=63, seed=42, store_paths=True)
+        paths = result.equity_paths
+        peaks = np.maximum.accumulate(paths, axis=1)
+        expected = ((paths - peaks) / peaks).min(axis=1)
+        np.testing.assert_allclose(result.path_max_drawdowns, expected, atol=1e-5)
+
+    def test_terminal_wealth_matches_stored_paths(self):
+        ret = _sample_returns()
+        result = run_monte_carlo(ret, n_paths=100, n_days=30, seed=42, store_paths=True)
+        np.testing.assert_allclose(result.terminal_wealth, result.equity_paths[:, -1])
+
+    def test_paths_are_float32(self):
+        ret = _sample_returns()
+        result = run_monte_carlo(ret, n_paths=50, n_days=30, seed=42, store_paths=True)
+        assert result.equity_paths.dtype == np.float32
+
     def test_median_less_than_mean(self):
         """Log-normal distribution: median < mean due to positive skew."""
         ret = _sample_returns()
@@ -133,3 +158,258 @@ class TestMultiAssetMode:
         )
         assert result.terminal_wealth.shape == (200,)
         assert (result.terminal_wealth > 0).all()
+
+
+class TestBackends:
+    def test_numba_matches_numpy_statistics(self):
+        pytest.importorskip("numba")
+        ret = _sample_returns()
+        nb = run_monte_carlo(ret, n_paths=20_000, n_days=252, seed=42, backend="numba")
+        npy = run_monte_carlo(ret, n_paths=20_000, n_days=252, seed=42, backend="numpy")
+        assert nb.median_terminal_wealth == pytest.approx(
+            npy.median_terminal_wealth, rel=0.01
+        )
+        assert nb.median_max_drawdown == pytest.approx(
+            npy.median_max_drawdown, rel=0.05
+        )
+
+    def test_numba_store_paths_consistent(self):
+        pytest.importorskip("numba")
+        ret = _sample_returns()
+        result = run_monte_carlo(
+            ret, n_paths=100, n_days=30, seed=42, store_paths=True, backend="numba"
+        )
+        assert result.equity_paths.shape == (100, 31)
+        np.testing.assert_array_equal(result.equity_paths[:, 0], result.initial_capital)
+        np.testing.assert_allclose(
+            result.terminal_wealth, result.equity_paths[:, -1], rtol=1e-6
+        )
+
+    def test_numba_streams_share_no_state(self):
+        pytest.importorskip("numba")
+        from src.monte_carlo._numba_kernels import _stream_state
+
+        words = [
+            w
+            for stream in range(1_000)
+            for w in _stream_state(np.uint64(42), np.uint64(stream))
+        ]
+        assert len(set(words)) == len(words)
+
+    def test_numba_accepts_none_seed(self):
+        pytest.importorskip("numba")
+        ret = _sample_returns()
+        result = run_monte_carlo(
+            ret, n_paths=100, n_days=30, seed=None, backend="numba"
+        )
+        assert np.isfinite(result.terminal_wealth).all()
+
+    def test_warmup_compiles_kernel(self):
+        pytest.importorskip("numba")
+        from src.monte_carlo import simulation
+
+        assert simulation.warmup_numba() is True
+        assert len(simulation._numba_simulate_paths.signatures) >= 1
+
+    def test_warmup_without_numba_is_noop(self, monkeypatch):
+        from src.monte_carlo import simulation
+
+        monkeypatch.setattr(simulation, "_numba_simulate_paths", None)
+        assert simulation.warmup_numba() is False
+
+    def test_jax_kernel_matches_numpy_statistics(self):
+        pytest.importorskip("jax")
+        from src.monte_carlo import _jax_kernels
+
+        ret = _sample_returns()
+        hist_log = np.log1p(ret.to_numpy())
+        log_wealth, terminal_log, mdd = _jax_kernels.simulate_paths(
+            float(hist_log.mean()),
+            float(hist_log.std(ddof=1)),
+            n_paths=20_000,
+            n_days=252,
+            seed=42,
+            antithetic=True,
+            store_paths=True,
+            dtype=np.dtype(np.float32),
+        )
+        npy = run_monte_carlo(ret, n_paths=20_000, n_days=252, seed=42, backend="numpy")
+        assert log_wealth.shape == (20_000, 252)
+        np.testing.assert_allclose(log_wealth[:, -1], terminal_log)
+        assert npy.initial_capital * np.exp(np.median(terminal_log)) == pytest.approx(
+            npy.median_terminal_wealth, rel=0.01
+        )
+        assert np.median(mdd) == pytest.approx(npy.median_max_drawdown, rel=0.05)
+
+    def test_jax_without_gpu_falls_back_to_numpy(self, monkeypatch):
+        pytest.importorskip("jax")
+        from src.monte_carlo import _jax_kernels
+
+        monkeypatch.setattr(_jax_kernels, "gpu_available", lambda: False)
+        ret = _sample_returns()
+        jx = run_monte_carlo(ret, n_paths=500, n_days=50, seed=1, backend="jax")
+        npy = run_monte_carlo(ret, n_paths=500, n_days=50, seed=1, backend="numpy")
+        np.testing.assert_array_equal(jx.terminal_wealth, npy.terminal_wealth)
+
+    def test_jax_import_failure_falls_back_to_numpy(self, monkeypatch):
+        from src.monte_carlo import simulation
+
+        monkeypatch.setattr(simulation, "_load_jax_kernels", lambda: None)
+        ret = _sample_returns()
+        jx = run_monte_carlo(ret, n_paths=500, n_days=50, seed=1, backend="jax")
+        npy = run_monte_carlo(ret, n_paths=500, n_days=50, seed=1, backend="numpy")
+        np.testing.assert_array_equal(jx.terminal_wealth, npy.terminal_wealth)
+
+    def test_unknown_backend_raises(self):
+        with pytest.raises(ValueError, match="backend"):
+            run_monte_carlo(_sample_returns(), n_paths=10, n_days=5, backend="cuda")
+
+
+class TestSamplingMethods:
+    @pytest.mark.parametrize("backend", ["numpy", "numba"])
+    def test_antithetic_pairs_mirror(self, backend):
+        if backend == "numba":
+            pytest.importorskip("numba")
+        ret = _sample_returns()
+        result = run_monte_carlo(
+            ret, n_paths=100, n_days=40, seed=3, method="antithetic", backend=backend
+        )
+        log_w = np.log(result.terminal_wealth / result.initial_capital)
+        mu = np.log1p(ret).mean() * 40
+        # Mirrored shocks → log terminal wealth is symmetric about the drift
+        np.testing.assert_allclose(log_w[:50] + log_w[50:], 2 * mu, atol=1e-4)
+
+    def test_antithetic_odd_path_count(self):
+        ret = _sample_returns()
+        result = run_monte_carlo(
+            ret, n_paths=101, n_days=20, seed=3, method="antithetic", backend="numpy"
+        )
+        assert result.terminal_wealth.shape == (101,)
+
+    def test_sobol_reproducible_and_shaped(self):
+        ret = _sample_returns()
+        r1 = run_monte_carlo(ret, n_paths=300, n_days=30, seed=5, method="sobol")
+        r2 = run_monte_carlo(ret, n_paths=300, n_days=30, seed=5, method="sobol")
+        assert r1.terminal_wealth.shape == (300,)
+        assert np.isfinite(r1.terminal_wealth).all()
+        np.testing.assert_array_equal(r1.terminal_wealth, r2.terminal_wealth)
+
+    def test_sobol_blocks_match_single_draw(self, caplog):
+        from scipy.special import ndtri
+        from scipy.stats import qmc
+
+        from src.monte_carlo.simulation import _standard_normal_shocks
+
+        n_paths = 3000  # spans several blocks, not a power of two
+        u = qmc.Sobol(d=20, scramble=True, seed=5).random_base2(m=12)[:n_paths]
+        shocks = _standard_normal_shocks(
+            None, n_paths, 20, "sobol", 5, np.dtype(np.float64)
+        )
+        np.testing.assert_array_equal(shocks, ndtri(u))
+        assert "power of two" in caplog.text
+
+    @pytest.mark.parametrize("method", ["antithetic", "sobol"])
+    def test_variance_reduction(self, method):
+        """Mean terminal wealth varies less across seeds than plain MC."""
+        ret = _sample_returns()
+
+        def spread(m):
+            means = [
+                run_monte_carlo(
+                    ret, n_paths=2000, n_days=63, seed=s, method=m, backend="numpy"
+                ).mean_terminal_wealth
+                for s in range(8)
+            ]
+            return np.std(means)
+
+        assert spread(method) < spread("mc")
+
+    def test_unknown_method_raises(self):
+        with pytest.raises(ValueError, match="sampling method"):
+            run_monte_carlo(_sample_returns(), n_paths=10, n_days=5, method="lhs")
+
+
+class TestStreaming:
+    def test_summaries_match_full_run(self):
+        ret = _sample_returns()
+        full = run_monte_carlo(ret, n_paths=20_000, n_days=252, store_paths=True)
+        streamed = run_monte_carlo_streaming(
+            ret, n_paths=20_000, n_days=252, chunk_size=1024
+        )
+        assert streamed.equity_paths is None
+        assert streamed.terminal_wealth.shape == (20_000,)
+        assert streamed.median_terminal_wealth == pytest.approx(
+            full.median_terminal_wealth, rel=0.01
+        )
+        assert streamed.prob_profit == pytest.approx(full.prob_profit, abs=0.02)
+
+        expected_fan = np.percentile(full.equity_paths, FAN_PERCENTILES, axis=0)
+        assert streamed.fan_percentiles.shape == (5, 253)
+        np.testing.assert_allclose(streamed.fan_percentiles, expected_fan, rtol=0.01)
+
+    def test_partial_last_chunk_and_reproducible(self):
+        ret = _sample_returns()
+        a = run_monte_carlo_streaming(ret, n_paths=2_500, n_days=20, chunk_size=1024)
+        b = run_monte_carlo_streaming(ret, n_paths=2_500, n_days=20, chunk_size=1024)
+        assert a.n_paths == len(a.terminal_wealth) == 2_500
+        np.testing.assert_array_equal(a.terminal_wealth, b.terminal_wealth)
+        np.testing.assert_allclose(a.fan_percentiles[:, 0], a.initial_capital)
+
+    def test_invalid_chunk_size_raises(self):
+        with pytest.raises(ValueError, match="chunk_size"):
+            run_monte_carlo_streaming(_sample_returns(), n_paths=10, chunk_size=0)
+
+
+class TestMultivariate:
+    @staticmethod
+    def _asset_returns(n: int = 750) -> pd.DataFrame:
+        rng = np.random.default_rng(5)
+        cov = np.array([[1.0, 0.6, 0.2], [0.6, 1.0, 0.3], [0.2, 0.3, 1.0]]) * 1.5e-4
+        draws = rng.multivariate_normal([6e-4, 4e-4, 2e-4], cov, n)
+        return pd.DataFrame(draws, columns=["A", "B", "C"])
+
+    def test_matches_multivariate_normal_mode(self):
+        from src.optimization.covariance import ledoit_wolf_fast
+
+        returns = self._asset_returns()
+        weights = pd.Series({"A": 0.5, "B": 0.3, "C": 0.2})
+        chol = run_monte_carlo_multivariate(
+            returns, weights, n_paths=20_000, n_days=252, seed=1
+        )
+        cov = pd.DataFrame(
+            ledoit_wolf_fast(returns.to_numpy()) * 252,
+            index=returns.columns,
+            columns=returns.columns,
+        )
+        mvn = run_monte_carlo(
+            returns @ weights,
+            weights=weights,
+            asset_returns=returns,
+            cov_matrix=cov,
+            n_paths=20_000,
+            n_days=252,
+            seed=1,
+        )
+        assert chol.median_terminal_wealth == pytest.approx(
+            mvn.median_terminal_wealth, rel=0.01
+        )
+        assert chol.median_max_drawdown == pytest.approx(
+            mvn.median_max_drawdown, rel=0.05
+        )
+
+    def test_chunking_preserves_shapes_and_paths(self):
+        returns = self._asset_returns()
+        weights = pd.Series({"A": 1.0})
+        result = run_monte_carlo_multivariate(
+            returns, weights, n_paths=300, n_days=40, store_paths=True, chunk_size=128
+        )
+        assert result.equity_paths.shape == (300, 41)
+        np.testing.assert_allclose(
+            result.terminal_wealth, result.equity_paths[:, -1], rtol=1e-6
+        )
+
+    def test_unknown_weight_ticker_raises(self):
+        with pytest.raises(ValueError, match="without returns"):
+            run_monte_carlo_multivariate(
+                self._asset_returns(), pd.Series({"ZZZ": 1.0}), n_paths=10, n_days=5
+            )
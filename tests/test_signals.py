@@ -0,0 +1,85 @@
+"""Tests for src/optimization/signals.py."""
+
+from __future__ import annotations
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.data.returns import compute_log_returns
+from src.optimization import signals
+from src.optimization.covariance import LedoitWolfCovariance
+from src.optimization.signals import (
+    clear_covariance_cache,
+    compute_covariance_cached,
+    make_kelly_signal,
+)
+
+
+@pytest.fixture(autouse=True)
+def _empty_cache():
+    clear_covariance_cache()
+    yield
+    clear_covariance_cache()
+
+
+class TestCovarianceCache:
+
+    def test_matches_estimator(self, sample_log_returns: pd.DataFrame):
+        cov = compute_covariance_cached(sample_log_returns, "ledoit_wolf")
+        expected = LedoitWolfCovariance().estimate(sample_log_returns)
+        pd.testing.assert_frame_equal(cov, expected)
+
+    def test_same_window_is_cache_hit(self, sample_log_returns: pd.DataFrame):
+        first = compute_covariance_cached(sample_log_returns, "ledoit_wolf")
+        second = compute_covariance_cached(sample_log_returns.copy(), "ledoit_wolf")
+        assert first is second
+
+    def test_method_is_part_of_key(self, sample_log_returns: pd.DataFrame):
+        lw = compute_covariance_cached(sample_log_returns, "ledoit_wolf")
+        sample = compute_covariance_cached(sample_log_returns, "sample")
+        assert lw is not sample
+        pd.testing.assert_frame_equal(sample, sample_log_returns.cov())
+
+    def test_different_values_same_dates_miss(self, sample_log_returns: pd.DataFrame):
+        first = compute_covariance_cached(sample_log_returns, "sample")
+        second = compute_covariance_cached(sample_log_returns * 2.0, "sample")
+        np.testing.assert_allclose(second.values, first.values * 4.0)
+
+    def test_half_and_full_kelly_share_covariance(self, sample_prices: pd.DataFrame):
+        half = make_kelly_signal(lookback=60, fraction=0.5, cov_method="ledoit_wolf")
+        full = make_kelly_signal(lookback=60, fraction=1.0, cov_method="ledoit_wolf")
+        current = pd.Series(0.0, index=sample_prices.columns)
+        date = sample_prices.index[-1]
+
+        half(date, sample_prices, current)
+        assert len(signals._COV_CACHE) == 1
+        full(date, sample_prices, current)
+        assert len(signals._COV_CACHE) == 1
+
+    def test_cache_is_bounded(self, sample_prices, monkeypatch):
+        monkeypatch.setattr(signals.config, "COV_CACHE_SIZE", 3)
+        log_returns = compute_log_returns(sample_prices)
+        for end in range(50, 60):
+            compute_covariance_cached(log_returns.iloc[:end], "sample")
+        assert len(signals._COV_CACHE) == 3
+
+
+class TestPrecomputedLogReturns:
+
+    def test_kelly_signal_opts_in(self):
+        assert make_kelly_signal().accepts_log_returns is True
+
+    def test_same_weights_with_precomputed_returns(self, sample_prices: pd.DataFrame):
+        signal = make_kelly_signal(lookback=60, fraction=0.5, cov_method="sample")
+        current = pd.Series(0.0, index=sample_prices.columns)
+        date = sample_prices.index[-1]
+
+        from_prices = signal(date, sample_prices, current)
+        from_returns = signal(
+            date,
+            sample_prices,
+            current,
+            log_returns=compute_log_returns(sample_prices),
+        )
+        pd.testing.assert_series_equal(from_prices, from_returns)